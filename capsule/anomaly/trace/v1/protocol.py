@@ -3,12 +3,29 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from functools import lru_cache
 from importlib import resources
 from typing import Any, Dict
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
-@dataclass(frozen=True)
+
+class _HashCache:
+    """Slot for a memoized hash on the frozen composite protocol nodes.
+
+    The slot lives outside the dataclass fields, so it is skipped by
+    ``fields()``/``asdict()`` and by the slotted dataclass pickle state; an
+    unpickled node rehashes under the current interpreter's hash seed.
+    """
+
+    __slots__ = ("_hash",)
+
+
+@dataclass(frozen=True, slots=True)
 class Trigger:
     """Capture the conditions that spark the anomaly trace."""
 
@@ -17,8 +34,18 @@ class Trigger:
     sector: str
     severity: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the trigger as a plain dictionary."""
+
+        return {
+            "source": self.source,
+            "condition": self.condition,
+            "sector": self.sector,
+            "severity": self.severity,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FallbackArc:
     """Describe the fallback arc that stabilizes the rupture."""
 
@@ -27,8 +54,18 @@ class FallbackArc:
     stabilization: str
     rhythm: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the fallback arc as a plain dictionary."""
+
+        return {
+            "color": self.color,
+            "structure": self.structure,
+            "stabilization": self.stabilization,
+            "rhythm": self.rhythm,
+        }
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RecoveryGlyph:
     """Information about the glyph embedded during recovery."""
 
@@ -37,16 +74,41 @@ class RecoveryGlyph:
     annotation: str
     alertFlag: bool
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the recovery glyph as a plain dictionary."""
+
+        return {
+            "status": self.status,
+            "location": self.location,
+            "annotation": self.annotation,
+            "alertFlag": self.alertFlag,
+        }
 
-@dataclass(frozen=True)
-class Response:
+
+@dataclass(frozen=True, slots=True)
+class Response(_HashCache):
     """The full response ritual triggered after detection."""
 
     fallbackArc: FallbackArc
     recoveryGlyph: RecoveryGlyph
 
+    def __hash__(self) -> int:
+        cached = getattr(self, "_hash", None)
+        if cached is None:
+            cached = hash((self.fallbackArc, self.recoveryGlyph))
+            object.__setattr__(self, "_hash", cached)
+        return cached
 
-@dataclass(frozen=True)
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the response ritual as a plain dictionary."""
+
+        return {
+            "fallbackArc": self.fallbackArc.to_dict(),
+            "recoveryGlyph": self.recoveryGlyph.to_dict(),
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class EmissionArc:
     """Visual grammar describing the emission arc."""
 
@@ -55,8 +117,18 @@ class EmissionArc:
     shimmer: str
     trail: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the emission arc as a plain dictionary."""
 
-@dataclass(frozen=True)
+        return {
+            "tone": self.tone,
+            "gesture": self.gesture,
+            "shimmer": self.shimmer,
+            "trail": self.trail,
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class TransitNode:
     """Visual grammar describing the transit node behavior."""
 
@@ -64,16 +136,40 @@ class TransitNode:
     reaction: str
     reroute: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the transit node as a plain dictionary."""
+
+        return {
+            "collision": self.collision,
+            "reaction": self.reaction,
+            "reroute": self.reroute,
+        }
+
 
-@dataclass(frozen=True)
-class VisualGrammar:
+@dataclass(frozen=True, slots=True)
+class VisualGrammar(_HashCache):
     """Visual grammar for rendering the anomaly trace."""
 
     emissionArc: EmissionArc
     transitNode: TransitNode
 
+    def __hash__(self) -> int:
+        cached = getattr(self, "_hash", None)
+        if cached is None:
+            cached = hash((self.emissionArc, self.transitNode))
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the visual grammar as a plain dictionary."""
+
+        return {
+            "emissionArc": self.emissionArc.to_dict(),
+            "transitNode": self.transitNode.to_dict(),
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attestation:
     """Attestation guarantees for the anomaly trace capsule."""
 
@@ -82,9 +178,19 @@ class Attestation:
     replayReady: bool
     contributorTrainable: bool
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the attestation flags as a plain dictionary."""
+
+        return {
+            "emotionallyLayered": self.emotionallyLayered,
+            "sceneAware": self.sceneAware,
+            "replayReady": self.replayReady,
+            "contributorTrainable": self.contributorTrainable,
+        }
+
 
-@dataclass(frozen=True)
-class AnomalyTraceProtocol:
+@dataclass(frozen=True, slots=True)
+class AnomalyTraceProtocol(_HashCache):
     """Full anomaly trace capsule definition."""
 
     capsuleId: str
@@ -96,14 +202,47 @@ class AnomalyTraceProtocol:
     attestation: Attestation
     status: str
 
+    def __hash__(self) -> int:
+        cached = getattr(self, "_hash", None)
+        if cached is None:
+            cached = hash(
+                (
+                    self.capsuleId,
+                    self.title,
+                    self.description,
+                    self.trigger,
+                    self.response,
+                    self.visualGrammar,
+                    self.attestation,
+                    self.status,
+                )
+            )
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
     def to_dict(self) -> Dict[str, Any]:
         """Render the protocol as a serializable dictionary."""
 
-        return asdict(self)
+        return {
+            "capsuleId": self.capsuleId,
+            "title": self.title,
+            "description": self.description,
+            "trigger": self.trigger.to_dict(),
+            "response": self.response.to_dict(),
+            "visualGrammar": self.visualGrammar.to_dict(),
+            "attestation": self.attestation.to_dict(),
+            "status": self.status,
+        }
 
     def to_json(self, *, indent: int = 2) -> str:
-        """Render the protocol as a JSON string."""
+        """Render the protocol as a JSON string.
+
+        ``orjson`` only supports two-space indentation, so other ``indent``
+        values fall back to the standard library encoder.
+        """
 
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
 
@@ -169,14 +308,30 @@ def default_protocol_dict() -> Dict[str, Any]:
     return DEFAULT_PROTOCOL.to_dict()
 
 
+@lru_cache(maxsize=4)
 def default_protocol_json(*, indent: int = 2) -> str:
-    """Return the protocol definition serialized as JSON."""
+    """Return the protocol definition serialized as JSON.
+
+    ``DEFAULT_PROTOCOL`` is frozen, so the rendered string is cached per
+    ``indent`` value.
+    """
 
     return DEFAULT_PROTOCOL.to_json(indent=indent)
 
 
+@lru_cache(maxsize=1)
+def _protocol_resource_bytes() -> bytes:
+    return resources.files(__package__).joinpath("protocol.json").read_bytes()
+
+
 def load_protocol_resource() -> Dict[str, Any]:
-    """Load the fossilized protocol JSON resource bundled with the capsule."""
+    """Load the fossilized protocol JSON resource bundled with the capsule.
+
+    The resource bytes are read once per process; each call parses them
+    into a fresh dictionary so callers may mutate the result.
+    """
 
-    with resources.files(__package__).joinpath("protocol.json").open("r", encoding="utf-8") as fp:
-        return json.load(fp)
+    data = _protocol_resource_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
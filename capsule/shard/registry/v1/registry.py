@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Dict, Iterable, Iterator, Mapping, MutableMapping, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional
 
 Hook = Callable[["Shard"], None]
 
@@ -27,8 +27,10 @@ class ShardLifecycleEvent(str, Enum):
     def from_value(cls, value: "ShardLifecycleEvent | str") -> "ShardLifecycleEvent":
         """Normalize a string value to a lifecycle enum."""
 
-        if isinstance(value, cls):
-            return value
+        try:
+            return _EVENT_CACHE[value]
+        except (KeyError, TypeError):
+            pass
         try:
             return cls(value)
         except ValueError as exc:  # pragma: no cover - defensive branch
@@ -36,14 +38,54 @@ class ShardLifecycleEvent(str, Enum):
             raise ValueError(f"Unknown lifecycle event '{value}'. Expected one of: {valid}.") from exc
 
 
-@dataclass
+# Members of a str enum hash and compare like their values, so this table
+# resolves both "on_emit" and ShardLifecycleEvent.EMIT with one lookup.
+_EVENT_CACHE: Dict[str, ShardLifecycleEvent] = {event.value: event for event in ShardLifecycleEvent}
+
+# Position of each lifecycle event inside a shard's fixed-size hook table.
+_EVENT_INDEX: Dict[ShardLifecycleEvent, int] = {
+    event: index for index, event in enumerate(ShardLifecycleEvent)
+}
+
+
+class _FrozenPayloadMap(dict):
+    """Read-only ``dict`` snapshot of a shard's emotional payload map.
+
+    Unlike ``MappingProxyType`` it is still a ``dict``, so shards keep
+    supporting ``copy.deepcopy``, ``pickle`` and ``dataclasses.asdict``.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: object, **kwargs: object) -> None:
+        raise TypeError("emotional_payload_map is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Rebuild from a plain dict; the default dict protocol would replay
+        # items through the blocked ``__setitem__``.
+        return (type(self), (dict(self),))
+
+
+def _empty_hook_table() -> List[Optional[Hook]]:
+    return [None] * len(_EVENT_INDEX)
+
+
+@dataclass(slots=True)
 class Shard:
     """Represents a sovereign shard bound to a contributor braid node."""
 
     shard_id: str
     overlay_signature: str
     emotional_payload_map: Mapping[str, str]
-    _hooks: MutableMapping[ShardLifecycleEvent, Hook] = field(default_factory=dict, init=False, repr=False)
+    _hooks: List[Optional[Hook]] = field(default_factory=_empty_hook_table, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Snapshot the payload map into a read-only dict so later mutation by
+        # the caller cannot leak into the shard.
+        self.emotional_payload_map = _FrozenPayloadMap(self.emotional_payload_map)
 
     def register_hook(self, event: ShardLifecycleEvent | str, callback: Hook) -> None:
         """Register a ritual callback for a shard lifecycle event."""
@@ -51,7 +93,7 @@ class Shard:
         lifecycle_event = ShardLifecycleEvent.from_value(event)
         if not callable(callback):
             raise TypeError("Lifecycle hook callback must be callable.")
-        self._hooks[lifecycle_event] = callback
+        self._hooks[_EVENT_INDEX[lifecycle_event]] = callback
 
     def emit(self) -> None:
         """Trigger the shard's emit ritual."""
@@ -76,8 +118,8 @@ class Shard:
     def _trigger(self, event: ShardLifecycleEvent) -> None:
         """Invoke a lifecycle hook if registered."""
 
-        hook = self._hooks.get(event)
-        if hook:
+        hook = self._hooks[_EVENT_INDEX[event]]
+        if hook is not None:
             hook(self)
 
 
@@ -115,8 +157,10 @@ class ShardRegistry:
     def ensure_overlay(self, shard_id: str, overlay_signature: str) -> Shard:
         """Validate overlay attestation before returning the shard."""
 
-        shard = self.require(shard_id)
-        if not shard.validate_overlay(overlay_signature):
+        shard = self._shards.get(shard_id)
+        if shard is None:
+            raise KeyError(f"Shard '{shard_id}' is not registered.")
+        if overlay_signature != shard.overlay_signature:
             raise PermissionError(
                 f"Overlay attestation mismatch for shard '{shard_id}'."
             )
@@ -126,8 +170,10 @@ class ShardRegistry:
         """Trigger a lifecycle ritual on a registered shard."""
 
         lifecycle_event = ShardLifecycleEvent.from_value(event)
-        shard = self.require(shard_id)
-        if overlay_signature is not None and not shard.validate_overlay(overlay_signature):
+        shard = self._shards.get(shard_id)
+        if shard is None:
+            raise KeyError(f"Shard '{shard_id}' is not registered.")
+        if overlay_signature is not None and overlay_signature != shard.overlay_signature:
             raise PermissionError(
                 f"Overlay attestation mismatch for shard '{shard_id}' during {lifecycle_event.value}."
             )
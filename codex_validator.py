@@ -1,5 +1,5 @@
 """Schemas and helpers used by FastAPI endpoints for validation."""
-from typing import Any, Dict, Type
+from typing import Any, Callable, Dict, Tuple, Type
 
 from pydantic import BaseModel, ValidationError
 
@@ -19,11 +19,30 @@ class OverrideRequest(BaseModel):
     target: str
 
 
+_SchemaMethods = Tuple[Callable[[Any], BaseModel], Callable[[BaseModel], Dict[str, Any]]]
+
+# Resolved (validate, dump) callables per schema so each request skips the
+# attribute lookups and, on Pydantic v2, the deprecated v1 shims.
+_SCHEMA_CACHE: Dict[Type[BaseModel], _SchemaMethods] = {}
+
+
+def _schema_methods(schema: Type[BaseModel]) -> _SchemaMethods:
+    methods = _SCHEMA_CACHE.get(schema)
+    if methods is None:
+        if hasattr(schema, "model_validate"):
+            methods = (schema.model_validate, schema.model_dump)
+        else:
+            methods = (schema.parse_obj, schema.dict)
+        _SCHEMA_CACHE[schema] = methods
+    return methods
+
+
 def validate_payload(schema: Type[BaseModel], payload: Dict[str, Any]) -> Dict[str, Any]:
     """Validate payloads against the provided Pydantic schema."""
 
+    validate, dump = _schema_methods(schema)
     try:
-        validated = schema(**payload)
-        return {"valid": True, "data": validated.dict()}
+        validated = validate(payload)
+        return {"valid": True, "data": dump(validated)}
     except ValidationError as exc:
         return {"valid": False, "errors": exc.errors()}
@@ -1,25 +1,27 @@
 import json
-import json
+import mmap
+import os
+from ipaddress import ip_address, ip_network
 from pathlib import Path
 from time import time
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from pathlib import Path
-from time import time
-from ipaddress import ip_address, ip_network
-import json
-from ipaddress import ip_address, ip_network
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 from codex_validator import Credential, OverrideRequest, validate_payload
-from orchestrator.config import CAPSULE as ORCHESTRATOR_CAPSULE, FlowSubmission
-from previz.ledger import LIBRARY
+from orchestrator.config import CAPSULE as ORCHESTRATOR_CAPSULE, FlowSubmission, load_capsule
+from previz.ledger import LIBRARY, load_library
 from previz.world_engine import WorldEngine
 from screenplay import LIBRARY as SCREENPLAY_LIBRARY
-from ssot.binder import binder
+from ssot.binder import binder, load_binder
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse if orjson else JSONResponse)
 
 WORLD_ENGINE = WorldEngine()
 
@@ -35,14 +37,6 @@ _BLOCKED_NETWORKS = tuple(
     )
 )
 
-_BLOCKED_NETWORKS = [
-    ip_network("3.134.238.10/32"),
-    ip_network("3.129.111.220/32"),
-    ip_network("52.15.118.168/32"),
-    ip_network("74.220.50.0/24"),
-    ip_network("74.220.58.0/24"),
-]
-
 
 @app.middleware("http")
 async def blocklisted_ip_guard(request: Request, call_next):
@@ -63,42 +57,100 @@ async def blocklisted_ip_guard(request: Request, call_next):
                     )
     return await call_next(request)
 
+# Registries at least this large are parsed straight from a memory map;
+# below it the mmap setup costs more than a plain read.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _load_registry(path: Path):
+    """Parse a JSON registry file, memory-mapping large files for orjson."""
+
+    if orjson is None:
+        with path.open("r", encoding="utf-8") as handle:
+            return json.load(handle)
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return orjson.loads(handle.read())
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+
+
 # Load the avatar registry into memory at startup. This registry is
 # treated as read-only and anchors avatar logic to the DimIndex scroll.
 _registry_path = Path(__file__).resolve().parent / "avatar_registry.json"
 try:
-    with _registry_path.open("r", encoding="utf-8") as _f:
-        AVATAR_REGISTRY = json.load(_f)
+    AVATAR_REGISTRY = _load_registry(_registry_path)
 except FileNotFoundError:
     # Fallback to empty registry if file is missing
     AVATAR_REGISTRY = {}
 
-@app.get("/health")
-def health_check():
-    """Return a simple JSON status to indicate service liveness."""
-    return {"status": "alive"}
+def _encode_json(payload) -> bytes:
+    """Encode ``payload`` the way the default response class would."""
 
+    content = jsonable_encoder(payload)
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-@app.middleware("http")
-async def enforce_blocklist(request: Request, call_next):
-    """Deny access to requests originating from blocked networks."""
 
-    client = request.client
-    if client and client.host:
-        try:
-            client_ip = ip_address(client.host)
-        except ValueError:
-            client_ip = None
-        if client_ip and any(client_ip in network for network in _BLOCKED_NETWORKS):
-            raise HTTPException(status_code=403, detail="request blocked")
-    response = await call_next(request)
-    return response
+class _CachedBody:
+    """Pre-encoded JSON body for an endpoint backed by a read-only source.
+
+    Routes pass the source resolved at request time through its cached
+    loader, so the body is rebuilt once the loader cache is cleared and a
+    new source object is loaded.
+    """
+
+    __slots__ = ("_build", "_source", "_body")
+
+    def __init__(self, build):
+        self._build = build
+        self._source = None
+        self._body = None
+
+    def response(self, source) -> Response:
+        if self._body is None or source is not self._source:
+            self._body = _encode_json(self._build(source))
+            self._source = source
+        return Response(content=self._body, media_type="application/json")
+
+
+def _previz_ledger_index(library):
+    ledgers = []
+    for summary in library.list_summaries():
+        ledgers.append({
+            "scene": summary.scene,
+            "metadata": summary.metadata,
+        })
+    return {"ledgers": ledgers, "count": len(ledgers)}
+
+
+_HEALTH_BODY = b'{"status":"alive"}'
+_HEALTHZ_TEMPLATE = b'{"ok":true,"ts":%d}'
+
+_SSOT_REGISTRY_BODY = _CachedBody(lambda source: source.as_dict())
+_ORCHESTRATOR_CAPSULE_BODY = _CachedBody(lambda source: source.dict())
+_PREVIZ_LEDGERS_BODY = _CachedBody(_previz_ledger_index)
+
+
+@app.get("/health")
+def health_check():
+    """Return a simple JSON status to indicate service liveness."""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/healthz")
 def readiness_check():
     """Expose readiness details compatible with container probes."""
-    return {"ok": True, "ts": int(time() * 1000)}
+    return Response(
+        content=_HEALTHZ_TEMPLATE % int(time() * 1000),
+        media_type="application/json",
+    )
 
 
 @app.get("/avatars")
@@ -174,7 +226,7 @@ async def onboard_agent(request: Request):
 def ssot_registry():
     """Return the SSOT binder with Merkle metadata."""
 
-    return binder.as_dict()
+    return _SSOT_REGISTRY_BODY.response(load_binder())
 
 
 @app.post("/ssot/registry/validate")
@@ -189,7 +241,7 @@ async def ssot_registry_validate(request: Request):
 def orchestrator_capsule():
     """Return the orchestrator capsule specification."""
 
-    return ORCHESTRATOR_CAPSULE.dict()
+    return _ORCHESTRATOR_CAPSULE_BODY.response(load_capsule())
 
 
 @app.post("/orchestrator/route")
@@ -236,13 +288,7 @@ def screenplay_capsule(capsule_id: str):
 def previz_ledgers():
     """List available PreViz ledgers with summary metadata."""
 
-    ledgers = []
-    for summary in LIBRARY.list_summaries():
-        ledgers.append({
-            "scene": summary.scene,
-            "metadata": summary.metadata,
-        })
-    return {"ledgers": ledgers, "count": len(ledgers)}
+    return _PREVIZ_LEDGERS_BODY.response(load_library())
 
 
 @app.get("/previz/ledgers/{scene}")
@@ -36,14 +36,22 @@ class OrchestratorCapsule(BaseModel):
     def validate_sequence(self, sequence: Sequence[str]) -> "FlowCheckResult":
         """Validate a requested sequence against the canonical flow order."""
 
+        flow_order = self.flow_order
+        flow_steps = set(flow_order)
         normalized = [step.strip() for step in sequence if step]
-        missing = [step for step in self.flow_order if step not in normalized]
-        extras = [step for step in normalized if step not in self.flow_order]
-        aligned = [step for step in normalized if step in self.flow_order]
-        in_order = aligned == self.flow_order[: len(aligned)]
+        normalized_steps = set(normalized)
+        missing = [step for step in flow_order if step not in normalized_steps]
+        extras: List[str] = []
+        aligned: List[str] = []
+        for step in normalized:
+            if step in flow_steps:
+                aligned.append(step)
+            else:
+                extras.append(step)
+        in_order = aligned == flow_order[: len(aligned)]
         next_expected = None
-        if not missing and len(aligned) < len(self.flow_order):
-            next_expected = self.flow_order[len(aligned)]
+        if not missing and len(aligned) < len(flow_order):
+            next_expected = flow_order[len(aligned)]
         valid = not missing and not extras and in_order
         return FlowCheckResult(
             valid=valid,
@@ -99,7 +107,13 @@ def load_capsule() -> OrchestratorCapsule:
     return OrchestratorCapsule.parse_obj(payload)
 
 
-CAPSULE = load_capsule()
+def __getattr__(name: str):
+    # ``CAPSULE`` is resolved on first access so importing this module does
+    # not read and parse the capsule from disk.
+    if name == "CAPSULE":
+        return load_capsule()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CAPSULE",
@@ -2,15 +2,22 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
-class SubjectPose(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class SubjectPose:
     """Pose vector for a subject (car/avatar) in a frame."""
 
     x: float
@@ -18,7 +25,8 @@ class SubjectPose(BaseModel):
     yaw: float
 
 
-class CameraState(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CameraState:
     """Camera transform metadata for a frame."""
 
     pan: float
@@ -26,39 +34,126 @@ class CameraState(BaseModel):
     zoom: float
 
 
-class MotionFrame(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class MotionFrame:
     """One frame in the motion ledger."""
 
     frame: int
-    cars: Dict[str, SubjectPose] = Field(default_factory=dict)
+    cars: Dict[str, SubjectPose] = field(default_factory=dict)
     camera: CameraState
 
 
+# Ledgers under data/previz are produced by our own tooling, so the library
+# builds them without re-running pydantic validation.  Flip this off to
+# validate every on-disk ledger (e.g. in CI when the data changes).
+TRUST_ONDISK_LEDGERS = True
+
+# Upper bound on threads used to read ledger files when building a library.
+_MAX_LOAD_WORKERS = 8
+
+
+def _frame_number(frame: MotionFrame) -> int:
+    return frame.frame
+
+
+# The ``_coerce_*`` helpers run inside a pydantic validator, which only turns
+# ValueError/TypeError/AssertionError into a ValidationError, so malformed
+# input is reported with those rather than KeyError/AttributeError.
+def _mapping(value: Any, kind: str) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        raise TypeError(f"{kind} must be a mapping, not {type(value).__name__}")
+    return value
+
+
+def _required(value: Dict[str, Any], key: str, kind: str) -> Any:
+    try:
+        return value[key]
+    except KeyError:
+        raise ValueError(f"{kind} is missing required field '{key}'") from None
+
+
+def _coerce_pose(value: Any) -> SubjectPose:
+    if isinstance(value, SubjectPose):
+        return value
+    value = _mapping(value, "pose")
+    return SubjectPose(
+        x=float(_required(value, "x", "pose")),
+        y=float(_required(value, "y", "pose")),
+        yaw=float(_required(value, "yaw", "pose")),
+    )
+
+
+def _coerce_camera(value: Any) -> CameraState:
+    if isinstance(value, CameraState):
+        return value
+    value = _mapping(value, "camera")
+    return CameraState(
+        pan=float(_required(value, "pan", "camera")),
+        tilt=float(_required(value, "tilt", "camera")),
+        zoom=float(_required(value, "zoom", "camera")),
+    )
+
+
+def _coerce_frame(value: Any) -> MotionFrame:
+    if isinstance(value, MotionFrame):
+        return value
+    value = _mapping(value, "frame")
+    cars = _mapping(value.get("cars") or {}, "frame cars")
+    return MotionFrame(
+        frame=int(_required(value, "frame", "frame")),
+        cars={car_id: _coerce_pose(pose) for car_id, pose in cars.items()},
+        camera=_coerce_camera(_required(value, "camera", "frame")),
+    )
+
+
 class MotionLedger(BaseModel):
     """Full ledger for a scene."""
 
     capsule_id: str
     scene: str
     fps: int
-    frames: List[MotionFrame]
+    # Holds MotionFrame instances built by ``build_frames``. Typed loosely so
+    # pydantic does not re-validate every slotted frame after construction.
+    frames: List[Any]
     style_capsules: List[str] = Field(default_factory=list)
+    # Per-car pose tracks, built on the first ``track_for`` call.
+    _tracks: Optional[Dict[str, List[SubjectPose]]] = PrivateAttr(default=None)
+
+    @validator("frames", pre=True)
+    def build_frames(cls, value: List[Any]) -> List[MotionFrame]:
+        return [_coerce_frame(item) for item in value]
 
     @validator("frames")
     def ensure_sorted_frames(cls, value: List[MotionFrame]) -> List[MotionFrame]:
-        return sorted(value, key=lambda frame: frame.frame)
+        return sorted(value, key=_frame_number)
+
+    def dict(self, **kwargs: Any) -> Dict[str, Any]:  # type: ignore[override]
+        # Frames are slotted dataclasses rather than nested models, so expand
+        # them to plain dicts to keep the nested-dict output models gave.
+        payload = super().dict(**kwargs)
+        frames = payload.get("frames")
+        if frames is not None:
+            payload["frames"] = [
+                asdict(frame) if isinstance(frame, MotionFrame) else frame for frame in frames
+            ]
+        return payload
 
     def duration_seconds(self) -> float:
         if not self.frames:
             return 0.0
         first_frame = self.frames[0].frame
         last_frame = self.frames[-1].frame
-        return last_frame / max(self.fps, 1)
-        first_frame = self.frames[0].frame
-        last_frame = self.frames[-1].frame
         return (last_frame - first_frame) / max(self.fps, 1)
 
     def track_for(self, car_id: str) -> List[SubjectPose]:
-        return [frame.cars[car_id] for frame in self.frames if car_id in frame.cars]
+        tracks = self._tracks
+        if tracks is None:
+            tracks = {}
+            for frame in self.frames:
+                for frame_car_id, pose in frame.cars.items():
+                    tracks.setdefault(frame_car_id, []).append(pose)
+            self._tracks = tracks
+        return list(tracks.get(car_id, ()))
 
     def summary(self) -> Dict[str, object]:
         return {
@@ -71,6 +166,20 @@ class MotionLedger(BaseModel):
         }
 
 
+def _read_ledger_payload(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _construct_trusted_ledger(payload: Dict[str, Any]) -> MotionLedger:
+    """Build a ledger from trusted data without pydantic validation."""
+
+    frames = sorted((_coerce_frame(item) for item in payload.get("frames", ())), key=_frame_number)
+    return MotionLedger.construct(**{**payload, "frames": frames})
+
+
 @dataclass
 class LedgerSummary:
     scene: str
@@ -88,10 +197,19 @@ class PrevizLibrary:
         self._load_index()
 
     def _load_index(self) -> None:
-        for path in sorted(self._root.glob("*.json")):
-            with path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-            ledger = MotionLedger.parse_obj(payload)
+        paths = sorted(self._root.glob("*.json"))
+        if len(paths) > 1:
+            # File reads and orjson parsing release the GIL; ledger models are
+            # still built here on the calling thread, in path order.
+            with ThreadPoolExecutor(max_workers=min(len(paths), _MAX_LOAD_WORKERS)) as pool:
+                payloads = list(pool.map(_read_ledger_payload, paths))
+        else:
+            payloads = [_read_ledger_payload(path) for path in paths]
+        for path, payload in zip(paths, payloads):
+            if TRUST_ONDISK_LEDGERS:
+                ledger = _construct_trusted_ledger(payload)
+            else:
+                ledger = MotionLedger.parse_obj(payload)
             self._cache[ledger.scene] = ledger
             self._index[ledger.scene] = path
 
@@ -115,7 +233,13 @@ def load_library() -> PrevizLibrary:
     return PrevizLibrary(root)
 
 
-LIBRARY = load_library()
+def __getattr__(name: str):
+    # ``LIBRARY`` is resolved on first access so importing this module does
+    # not read and parse the library from disk.
+    if name == "LIBRARY":
+        return load_library()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CameraState",
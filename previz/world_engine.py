@@ -10,35 +10,148 @@ validated inside automated pipelines.
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+import csv
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
 import hashlib
+import io
 import json
+import logging
+from operator import itemgetter
+import os
+import sys
 import time
-from typing import Dict, List, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+# (epoch second, formatted timestamp) of the last _utc_timestamp() call.
+_LAST_TIMESTAMP: Tuple[int, str] = (-1, "")
 
 
 def _utc_timestamp() -> str:
-    """Return a RFC3339 timestamp at UTC second resolution."""
+    """Return a RFC3339 timestamp at UTC second resolution.
+
+    Log lines and capsules are stamped in bursts, so the formatted string
+    is reused until the wall clock moves to the next second.
+    """
+
+    global _LAST_TIMESTAMP
+    now = int(time.time())
+    second, stamp = _LAST_TIMESTAMP
+    if now != second:
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _LAST_TIMESTAMP = (now, stamp)
+    return stamp
+
+
+def _canonical_json(payload: object) -> bytes:
+    """Return compact, key-sorted UTF-8 JSON used for capsule digests.
+
+    Both branches emit the same bytes (the form ``verify/canon.js`` hashes),
+    so digests do not depend on whether ``orjson`` is installed.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _compact_json(payload: object) -> str:
+    """Render *payload* as compact JSON for machine-read artifacts."""
+
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _pretty_json(payload: object) -> str:
+    """Render *payload* as two-space indented JSON for human inspection."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+logger = logging.getLogger(__name__)
+
+_REHEARSAL_BEATS = ("Entry", "Stabilize (CiCi)", "Gloh Flux", "Sol Ignition")
+_AURA_PHASES = ("curiosity", "intimacy", "clarity", "wisdom")
+_SHOT_LIST_COLUMNS = (
+    "beat",
+    "start_frame",
+    "end_frame",
+    "duration_frames",
+    "qlock_anchor_s",
+    "camera_grammar",
+)
+_shot_list_row = itemgetter(*_SHOT_LIST_COLUMNS)
+_beat_of = itemgetter("beat")
+_frame_idx_of = itemgetter("frame_idx")
+
+
+@lru_cache(maxsize=8)
+def _glyph_pulse_table(sample_rate_hz: int) -> Tuple[float, ...]:
+    """Glyph pulse for each frame position inside one second."""
+
+    return tuple(round(0.5 + 0.5 * step / sample_rate_hz, 4) for step in range(sample_rate_hz))
+
+
+@lru_cache(maxsize=8)
+def _timestamp_table(frames: int, sample_rate_hz: int) -> Tuple[float, ...]:
+    """Rounded relative timestamp (seconds) for each rehearsal frame."""
+
+    return tuple(round(frame_idx / sample_rate_hz, 3) for frame_idx in range(frames))
+
+
+@dataclass(slots=True)
+class _LedgerColumns:
+    """Column view of a rehearsal ledger generated by ``rehearse_scene``.
+
+    Row ``i`` describes frame ``i``; beats are stored as indexes into
+    ``beats`` so grouping passes compare small integers, not strings.
+    """
 
-    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    beats: Tuple[str, ...]
+    beat_index: array
+    qlock_tick: array
 
 
-@dataclass
+@dataclass(slots=True)
 class Capsule:
     """Represents a fossilized artifact tracked by the WorldEngine."""
 
     capsule_id: str
     data: Dict[str, object]
     fossilized_at: str = field(default_factory=_utc_timestamp)
+    digest: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.digest = self.compute_digest()
 
     def compute_digest(self) -> str:
-        """Compute a lineage-stable SHA-256 digest for *data*."""
+        """Compute a lineage-stable SHA-256 digest for *data*.
 
-        payload = json.dumps(self.data, sort_keys=True).encode("utf-8")
-        return f"sha256:{hashlib.sha256(payload).hexdigest()}"
+        The digest identifies lineage rather than guarding secrets, so the
+        hash is requested with ``usedforsecurity=False`` and stays available
+        on FIPS-restricted OpenSSL builds.
+        """
+
+        digest = hashlib.sha256(_canonical_json(self.data), usedforsecurity=False)
+        return f"sha256:{digest.hexdigest()}"
+
+    def as_ref(self) -> Dict[str, object]:
+        """Return a reference that pins the capsule by id and digest."""
+
+        return {"capsule_id": self.capsule_id, "digest": self.digest}
 
     def as_dict(self) -> Dict[str, object]:
         """Return a serialisable representation of the capsule."""
@@ -54,7 +167,9 @@ class Capsule:
 class WorldEngine:
     """Simulate the Qube-CiCi-Boo relay orchestration pipeline."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, verbose: bool = False) -> None:
+        if verbose:
+            _enable_cli_logging()
         self.governance = {"version": "v6.0", "trust_threshold": 90, "quorum_rule": "2-of-2"}
         self.previz_schema = {
             "version": "3.9.9",
@@ -62,16 +177,83 @@ class WorldEngine:
         }
         self.capsule_registry: Dict[str, Capsule] = {}
         self.artifacts: Dict[str, str] = {}
+        self._ledger_frames: List[Dict[str, object]] = []
+        self._ledger_columns: Optional[_LedgerColumns] = None
+        self._log_batch: Optional[List[Dict[str, object]]] = None
         self.audit_log: List[Dict[str, object]] = []
 
     # ------------------------------------------------------------------
     # Logging helpers
     def log_action(self, action: str, details: Dict[str, object]) -> None:
-        """Append an audit log entry and print it for CLI runs."""
+        """Append an audit log entry and log it at INFO level."""
 
         entry = {"timestamp": _utc_timestamp(), "action": action, "details": details}
         self.audit_log.append(entry)
-        print(f"[{entry['timestamp']}] ACTION: {action} - {json.dumps(details)}")
+        if self._log_batch is not None:
+            self._log_batch.append(entry)
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info("%s", _format_log_entry(entry))
+
+    @contextmanager
+    def batched_logs(self) -> Iterator[None]:
+        """Hold audit log output until the block exits, then emit it at once.
+
+        Entries still land in ``audit_log`` immediately; only the formatting
+        and handler I/O are deferred.  Nested blocks join the outer batch.
+        """
+
+        if self._log_batch is not None:
+            yield
+            return
+        self._log_batch = []
+        try:
+            yield
+        finally:
+            self.flush_log()
+            self._log_batch = None
+
+    def flush_log(self) -> None:
+        """Emit any audit entries held by ``batched_logs`` as one record."""
+
+        batch = self._log_batch
+        if not batch:
+            return
+        self._log_batch = []
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", "\n".join(_format_log_entry(entry) for entry in batch))
+
+    def pretty(self, artifact_name: str) -> str:
+        """Return *artifact_name* re-indented for reading.
+
+        JSON artifacts are stored compact for the pipelines that consume
+        them; other formats (JSONL, CSV) are returned unchanged.
+        """
+
+        payload = self.artifacts[artifact_name]
+        if not artifact_name.endswith(".json"):
+            return payload
+        return _pretty_json(json.loads(payload))
+
+    def dump_artifacts(self, dst_dir: Union[str, os.PathLike]) -> List[str]:
+        """Write every artifact into *dst_dir* and return the written paths.
+
+        Each payload is encoded once and handed to ``os.write`` directly,
+        bypassing the buffered text layer of ``open``.
+        """
+
+        os.makedirs(dst_dir, exist_ok=True)
+        written: List[str] = []
+        for name, payload in self.artifacts.items():
+            path = os.path.join(dst_dir, name)
+            data = memoryview(payload.encode("utf-8"))
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            written.append(path)
+        return written
 
     # ------------------------------------------------------------------
     # Capsule loaders and initial state
@@ -116,36 +298,46 @@ class WorldEngine:
 
         self.log_action("rehearse_scene", {"status": "starting", "sample_rate_hz": sample_rate_hz})
         frames = duration_s * sample_rate_hz
-        beats = ["Entry", "Stabilize (CiCi)", "Gloh Flux", "Sol Ignition"]
+        beats = list(_REHEARSAL_BEATS)
         beat_len = max(frames // len(beats), 1)
+        last_beat = len(beats) - 1
+        pulses = _glyph_pulse_table(sample_rate_hz)
+        timestamps = _timestamp_table(frames, sample_rate_hz)
+        ticks_every = 3 * sample_rate_hz
+        drift_delta = 0.005
         ledger_lines: List[Dict[str, object]] = []
+        beat_column = array("B")
+        qlock_column = array("L")
+
+        # Walk each beat's contiguous frame range instead of re-deriving the
+        # beat index per frame.
+        for beat_index, (beat, aura_phase) in enumerate(zip(beats, _AURA_PHASES)):
+            start = beat_index * beat_len
+            stop = frames if beat_index == last_beat else min(start + beat_len, frames)
+            beat_column.extend([beat_index] * max(stop - start, 0))
+            for frame_idx in range(start, stop):
+                qlock_tick = 3 * (frame_idx // ticks_every)
+                qlock_column.append(qlock_tick)
+                ledger_lines.append(
+                    {
+                        "frame_idx": frame_idx,
+                        "timestamp_rel_s": timestamps[frame_idx],
+                        "beat": beat,
+                        "pose_lock": "3q-window-stance",
+                        "camera_grammar": "glyph-orbit",
+                        "hud": {
+                            "glyph.pulse": pulses[frame_idx % sample_rate_hz],
+                            "aura.gold.phase": aura_phase,
+                            "qlock.tick_s": qlock_tick,
+                            "drift.delta": drift_delta,
+                        },
+                    }
+                )
 
-        for frame_idx in range(frames):
-            t_rel = frame_idx / sample_rate_hz
-            beat_index = min(frame_idx // beat_len, len(beats) - 1)
-            beat = beats[beat_index]
-            glyph_pulse = round(0.5 + 0.5 * (frame_idx % sample_rate_hz) / sample_rate_hz, 4)
-            aura_phase = ["curiosity", "intimacy", "clarity", "wisdom"][beat_index]
-            qlock_tick = int((t_rel // 3) * 3)
-            drift_delta = 0.005
-
-            ledger_lines.append(
-                {
-                    "frame_idx": frame_idx,
-                    "timestamp_rel_s": round(t_rel, 3),
-                    "beat": beat,
-                    "pose_lock": "3q-window-stance",
-                    "camera_grammar": "glyph-orbit",
-                    "hud": {
-                        "glyph.pulse": glyph_pulse,
-                        "aura.gold.phase": aura_phase,
-                        "qlock.tick_s": qlock_tick,
-                        "drift.delta": drift_delta,
-                    },
-                }
-            )
-
-        self.artifacts["ledger.motion.v2.jsonl"] = json.dumps(ledger_lines, indent=2)
+        self._ledger_frames = ledger_lines
+        self._ledger_columns = _LedgerColumns(tuple(beats), beat_column, qlock_column)
+        # One compact JSON object per line, as the artifact name promises.
+        self.artifacts["ledger.motion.v2.jsonl"] = "\n".join(_compact_json(line) for line in ledger_lines)
         capsule = Capsule(
             "capsule.rehearsal.boo.v2",
             {
@@ -245,7 +437,7 @@ class WorldEngine:
 
         capsule = Capsule(entry_id, data)
         self.capsule_registry[capsule.capsule_id] = capsule
-        self.artifacts["canon_entry.json"] = json.dumps(capsule.as_dict(), indent=2)
+        self.artifacts["canon_entry.json"] = _compact_json(capsule.as_dict())
         self.log_action("canon.inscribe", {"status": "sealed", "digest": capsule.digest})
         return capsule
 
@@ -276,17 +468,34 @@ class WorldEngine:
     # ------------------------------------------------------------------
     # Artifact generation helpers
     def _load_motion_ledger(self) -> List[Dict[str, object]]:
+        """Return the rehearsal frames, parsing the artifact only if needed.
+
+        ``rehearse_scene`` keeps its frame list in memory, so the usual path
+        skips decoding the JSON artifact it just encoded.
+        """
+
+        if self._ledger_frames:
+            return self._ledger_frames
         ledger_raw = self.artifacts.get("ledger.motion.v2.jsonl")
         if not ledger_raw:
             return []
-        return json.loads(ledger_raw)
+        loads = orjson.loads if orjson is not None else json.loads
+        if ledger_raw.lstrip().startswith("["):
+            # Ledgers written before the artifact became JSONL hold one array.
+            self._ledger_frames = loads(ledger_raw)
+        else:
+            self._ledger_frames = [loads(line) for line in ledger_raw.splitlines() if line.strip()]
+        return self._ledger_frames
 
-    def _require_capsules(self, *capsule_ids: str) -> None:
-        """Ensure the referenced capsules exist in the registry."""
+    def _resolve_capsules(self, *capsule_ids: str) -> Tuple[Capsule, ...]:
+        """Return the referenced capsules in order, raising if any are missing."""
 
-        missing = [capsule_id for capsule_id in capsule_ids if capsule_id not in self.capsule_registry]
-        if missing:
-            raise ValueError(f"missing capsules: {', '.join(missing)}")
+        registry = self.capsule_registry
+        try:
+            return tuple([registry[capsule_id] for capsule_id in capsule_ids])
+        except KeyError:
+            missing = [capsule_id for capsule_id in capsule_ids if capsule_id not in registry]
+            raise ValueError(f"missing capsules: {', '.join(missing)}") from None
 
     def generate_shot_list(self) -> List[Dict[str, object]]:
         """Create a CSV shot list by grouping frames per beat."""
@@ -295,49 +504,91 @@ class WorldEngine:
         if not ledger:
             raise ValueError("rehearsal ledger missing; run rehearse_scene first")
 
-        beat_frames: Dict[str, List[Dict[str, object]]] = {}
-        for frame in ledger:
-            beat_frames.setdefault(frame["beat"], []).append(frame)
+        if self._ledger_columns is not None:
+            shots = self._shots_from_columns(ledger, self._ledger_columns)
+        else:
+            shots = self._shots_from_frames(ledger)
+        self._validate_previz_invariants(shots)
 
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(_SHOT_LIST_COLUMNS)
+        writer.writerows(map(_shot_list_row, shots))
+        # The artifact has never carried a trailing newline.
+        self.artifacts["shot_list.csv"] = buffer.getvalue().removesuffix("\n")
+        return shots
+
+    @staticmethod
+    def _shots_from_columns(
+        ledger: Sequence[Dict[str, object]], columns: _LedgerColumns
+    ) -> List[Dict[str, object]]:
+        """Cut shots at beat boundaries of a ledger built by ``rehearse_scene``.
+
+        Beat indexes are non-decreasing there, so each beat's rows form one
+        contiguous run located by bisection.
+        """
+
+        beat_index = columns.beat_index
         shots: List[Dict[str, object]] = []
-        for beat, frames in beat_frames.items():
-            frames_sorted = sorted(frames, key=lambda item: item["frame_idx"])
-            start_frame = frames_sorted[0]["frame_idx"]
-            end_frame = frames_sorted[-1]["frame_idx"]
+        for code, beat in enumerate(columns.beats):
+            start = bisect_left(beat_index, code)
+            stop = bisect_left(beat_index, code + 1, start)
+            if start == stop:
+                continue
+            first = ledger[start]
+            start_frame = first["frame_idx"]
+            end_frame = ledger[stop - 1]["frame_idx"]
             shots.append(
                 {
                     "beat": beat,
                     "start_frame": start_frame,
                     "end_frame": end_frame,
                     "duration_frames": end_frame - start_frame + 1,
-                    "qlock_anchor_s": frames_sorted[0]["hud"]["qlock.tick_s"],
-                    "camera_grammar": frames_sorted[0]["camera_grammar"],
+                    "qlock_anchor_s": columns.qlock_tick[start],
+                    "camera_grammar": first["camera_grammar"],
                 }
             )
+        return shots
 
-        shots.sort(key=lambda shot: shot["start_frame"])
-        self._validate_previz_invariants(shots)
+    @staticmethod
+    def _shots_from_frames(ledger: Sequence[Dict[str, object]]) -> List[Dict[str, object]]:
+        """Group an arbitrary frame list by beat name.
+
+        Beats normally arrive as contiguous runs, so ``groupby`` hands over
+        whole runs and only each run's earliest and latest frame are merged
+        into the per-beat bounds; out-of-order input is still handled.
+        """
+
+        bounds: Dict[str, List[Dict[str, object]]] = {}
+        for beat, group in groupby(ledger, key=_beat_of):
+            run = list(group)
+            first = min(run, key=_frame_idx_of)
+            last = max(run, key=_frame_idx_of)
+            entry = bounds.get(beat)
+            if entry is None:
+                bounds[beat] = [first, last]
+                continue
+            if first["frame_idx"] < entry[0]["frame_idx"]:
+                entry[0] = first
+            if last["frame_idx"] >= entry[1]["frame_idx"]:
+                entry[1] = last
 
-        csv_buffer: List[List[object]] = [
-            ["beat", "start_frame", "end_frame", "duration_frames", "qlock_anchor_s", "camera_grammar"]
-        ]
-        for shot in shots:
-            csv_buffer.append(
-                [
-                    shot["beat"],
-                    shot["start_frame"],
-                    shot["end_frame"],
-                    shot["duration_frames"],
-                    shot["qlock_anchor_s"],
-                    shot["camera_grammar"],
-                ]
+        shots: List[Dict[str, object]] = []
+        for beat, (first, last) in bounds.items():
+            start_frame = first["frame_idx"]
+            end_frame = last["frame_idx"]
+            shots.append(
+                {
+                    "beat": beat,
+                    "start_frame": start_frame,
+                    "end_frame": end_frame,
+                    "duration_frames": end_frame - start_frame + 1,
+                    "qlock_anchor_s": first["hud"]["qlock.tick_s"],
+                    "camera_grammar": first["camera_grammar"],
+                }
             )
 
-        csv_lines: List[str] = []
-        for row in csv_buffer:
-            csv_lines.append(",".join(str(cell) for cell in row))
-
-        self.artifacts["shot_list.csv"] = "\n".join(csv_lines)
+        shots.sort(key=lambda shot: shot["start_frame"])
         return shots
 
     def _validate_previz_invariants(self, shots: Sequence[Dict[str, object]]) -> None:
@@ -377,7 +628,7 @@ class WorldEngine:
                 },
             )
             self.capsule_registry[motion_capsule.capsule_id] = motion_capsule
-            self.artifacts["motion.ledger.v2.json"] = json.dumps(motion_capsule.as_dict(), indent=2)
+            self.artifacts["motion.ledger.v2.json"] = _compact_json(motion_capsule.as_dict())
             self.log_action(
                 "render_final.motion_ledger",
                 {"status": "fossilized", "digest": motion_capsule.digest, "frames": frames_count},
@@ -402,7 +653,7 @@ class WorldEngine:
                 },
             )
             self.capsule_registry[replay_capsule.capsule_id] = replay_capsule
-            self.artifacts["replay.token.v2.json"] = json.dumps(replay_capsule.as_dict(), indent=2)
+            self.artifacts["replay.token.v2.json"] = _compact_json(replay_capsule.as_dict())
             self.log_action(
                 "render_final.replay_token",
                 {"status": "issued", "digest": replay_capsule.digest},
@@ -434,7 +685,7 @@ class WorldEngine:
                 },
             )
             self.capsule_registry[echo_capsule.capsule_id] = echo_capsule
-            self.artifacts["echo.scrollstream.v2.json"] = json.dumps(echo_capsule.as_dict(), indent=2)
+            self.artifacts["echo.scrollstream.v2.json"] = _compact_json(echo_capsule.as_dict())
             self.log_action(
                 "render_final.echo_scrollstream",
                 {"status": "inscribed", "digest": echo_capsule.digest},
@@ -460,7 +711,7 @@ class WorldEngine:
             "echo_digest": echo_capsule.digest,
             "shot_count": len(shots),
         }
-        self.artifacts["exports.json"] = json.dumps(exports, indent=2)
+        self.artifacts["exports.json"] = _compact_json(exports)
         self.log_action("finalize_and_bind", {"status": "complete", "exports": exports})
         return exports
 
@@ -552,7 +803,14 @@ class WorldEngine:
         """Emit the capsule.summary.manifest.v1 dual-root ledger."""
 
         self.log_action("summary_manifest.emit", {"status": "assembling"})
-        self._require_capsules(
+        (
+            motion_capsule,
+            replay_capsule,
+            echo_capsule,
+            rehearsal_capsule,
+            lora_capsule,
+            fork_capsule,
+        ) = self._resolve_capsules(
             "motion.ledger.v2",
             "replay.token.v2",
             "echo.scrollstream.v2",
@@ -561,27 +819,20 @@ class WorldEngine:
             "capsule.relay.scene.fork.v2",
         )
 
-        motion_capsule = self.capsule_registry["motion.ledger.v2"]
-        replay_capsule = self.capsule_registry["replay.token.v2"]
-        echo_capsule = self.capsule_registry["echo.scrollstream.v2"]
-        rehearsal_capsule = self.capsule_registry["capsule.rehearsal.boo.v2"]
-        lora_capsule = self.capsule_registry["boo.lora.map.v1"]
-        fork_capsule = self.capsule_registry["capsule.relay.scene.fork.v2"]
-
         manifest_payload = {
             "capsule_id": "capsule.summary.manifest.v1",
             "governance_version": self.governance["version"],
             "previz_schema": self.previz_schema,
             "roots": {
                 "finalization": {
-                    "motion_ledger": motion_capsule.as_dict(),
-                    "replay_token": replay_capsule.as_dict(),
-                    "echo_scrollstream": echo_capsule.as_dict(),
+                    "motion_ledger": motion_capsule.as_ref(),
+                    "replay_token": replay_capsule.as_ref(),
+                    "echo_scrollstream": echo_capsule.as_ref(),
                 },
                 "training": {
-                    "rehearsal": rehearsal_capsule.as_dict(),
-                    "lora_map": lora_capsule.as_dict(),
-                    "scene_fork": fork_capsule.as_dict(),
+                    "rehearsal": rehearsal_capsule.as_ref(),
+                    "lora_map": lora_capsule.as_ref(),
+                    "scene_fork": fork_capsule.as_ref(),
                 },
             },
             "artifacts": {
@@ -597,7 +848,7 @@ class WorldEngine:
 
         capsule = Capsule("capsule.summary.manifest.v1", manifest_payload)
         self.capsule_registry[capsule.capsule_id] = capsule
-        self.artifacts["capsule.summary.manifest.v1.json"] = json.dumps(capsule.as_dict(), indent=2)
+        self.artifacts["capsule.summary.manifest.v1.json"] = _compact_json(capsule.as_dict())
         self.log_action("summary_manifest.emit", {"status": "sealed", "digest": capsule.digest})
         return capsule
 
@@ -611,23 +862,33 @@ class WorldEngine:
         rehearsal_capsule = self.capsule_registry.get("capsule.rehearsal.boo.v2")
         sample_rate = rehearsal_capsule.data.get("sample_rate_hz") if rehearsal_capsule else 30
 
+        if self._ledger_columns is not None:
+            ticks: Sequence[int] = self._ledger_columns.qlock_tick
+            rows = _tick_run_starts(ticks, qlock_interval_s)
+        else:
+            ticks = [frame["hud"]["qlock.tick_s"] for frame in ledger]
+            rows = []
+            last_qlock = None
+            for row, tick in enumerate(ticks):
+                if tick != last_qlock and tick % qlock_interval_s == 0:
+                    rows.append(row)
+                    last_qlock = tick
+
         keyframes: List[Dict[str, object]] = []
-        last_qlock = None
-        for frame in ledger:
-            tick = frame["hud"]["qlock.tick_s"]
-            if tick != last_qlock and tick % qlock_interval_s == 0:
-                keyframes.append(
-                    {
-                        "frame_idx": frame["frame_idx"],
-                        "timestamp_rel_s": frame["timestamp_rel_s"],
-                        "beat": frame["beat"],
-                        "glyph": frame["hud"]["glyph.pulse"],
-                        "aura_phase": frame["hud"]["aura.gold.phase"],
-                        "drift_delta": frame["hud"]["drift.delta"],
-                        "qlock_tick_s": tick,
-                    }
-                )
-                last_qlock = tick
+        for row in rows:
+            frame = ledger[row]
+            hud = frame["hud"]
+            keyframes.append(
+                {
+                    "frame_idx": frame["frame_idx"],
+                    "timestamp_rel_s": frame["timestamp_rel_s"],
+                    "beat": frame["beat"],
+                    "glyph": hud["glyph.pulse"],
+                    "aura_phase": hud["aura.gold.phase"],
+                    "drift_delta": hud["drift.delta"],
+                    "qlock_tick_s": ticks[row],
+                }
+            )
 
         hud_payload = {
             "capsule_id": "capsule.preview.hud.v1",
@@ -640,7 +901,7 @@ class WorldEngine:
 
         capsule = Capsule("capsule.preview.hud.v1", hud_payload)
         self.capsule_registry[capsule.capsule_id] = capsule
-        self.artifacts["capsule.preview.hud.v1.json"] = json.dumps(capsule.as_dict(), indent=2)
+        self.artifacts["capsule.preview.hud.v1.json"] = _compact_json(capsule.as_dict())
         self.log_action("preview_hud.stage", {"status": "staged", "digest": capsule.digest, "keyframes": len(keyframes)})
         return capsule
 
@@ -656,7 +917,7 @@ class WorldEngine:
 
         # The scrollstream rehearsal depends on the rehearsal ledger and
         # finalization artifacts so contributors can trace both roots.
-        self._require_capsules(
+        linked = self._resolve_capsules(
             "capsule.rehearsal.boo.v2",
             "motion.ledger.v2",
             "replay.token.v2",
@@ -725,11 +986,7 @@ class WorldEngine:
                 }
             )
 
-        linked_capsules = {
-            key: self.capsule_registry[key].as_dict()
-            for key in ("capsule.rehearsal.boo.v2", "motion.ledger.v2", "replay.token.v2")
-            if key in self.capsule_registry
-        }
+        linked_capsules = {capsule.capsule_id: capsule.as_dict() for capsule in linked}
 
         payload = {
             "capsule_id": "capsule.rehearsal.scrollstream.v1",
@@ -752,10 +1009,7 @@ class WorldEngine:
 
         capsule = Capsule("capsule.rehearsal.scrollstream.v1", payload)
         self.capsule_registry[capsule.capsule_id] = capsule
-        self.artifacts["capsule.rehearsal.scrollstream.v1.json"] = json.dumps(
-            capsule.as_dict(),
-            indent=2,
-        )
+        self.artifacts["capsule.rehearsal.scrollstream.v1.json"] = _compact_json(capsule.as_dict())
         self.log_action(
             "rehearsal_scrollstream.stage",
             {"status": "sealed", "digest": capsule.digest, "events": len(ledger_lines)},
@@ -767,10 +1021,9 @@ class WorldEngine:
     def register_dualroot_selfie(self) -> Capsule:
         """Ensure the dual-root selfie capsule exists before feedback begins."""
 
-        self._require_capsules("capsule.summary.manifest.v1", "capsule.preview.hud.v1")
-
-        manifest_capsule = self.capsule_registry["capsule.summary.manifest.v1"]
-        hud_capsule = self.capsule_registry["capsule.preview.hud.v1"]
+        manifest_capsule, hud_capsule = self._resolve_capsules(
+            "capsule.summary.manifest.v1", "capsule.preview.hud.v1"
+        )
 
         existing = self.capsule_registry.get("capsule.selfie.dualroot.q.cici.v1")
         if existing:
@@ -800,7 +1053,7 @@ class WorldEngine:
 
         capsule = Capsule("capsule.selfie.dualroot.q.cici.v1", payload)
         self.capsule_registry[capsule.capsule_id] = capsule
-        self.artifacts["capsule.selfie.dualroot.q.cici.v1.json"] = json.dumps(capsule.as_dict(), indent=2)
+        self.artifacts["capsule.selfie.dualroot.q.cici.v1.json"] = _compact_json(capsule.as_dict())
         self.log_action("dualroot.selfie", {"status": "sealed", "digest": capsule.digest})
         return capsule
 
@@ -843,9 +1096,7 @@ class WorldEngine:
 
         capsule = Capsule("capsule.selfie.dualroot.q.cici.v1.feedback.v1", payload)
         self.capsule_registry[capsule.capsule_id] = capsule
-        self.artifacts["capsule.selfie.dualroot.q.cici.v1.feedback.v1.json"] = json.dumps(
-            capsule.as_dict(), indent=2
-        )
+        self.artifacts["capsule.selfie.dualroot.q.cici.v1.feedback.v1.json"] = _compact_json(capsule.as_dict())
         self.log_action("feedback_loop.stage", {"status": "sealed", "digest": capsule.digest})
         return capsule
 
@@ -868,7 +1119,7 @@ class WorldEngine:
 
         # The adjudication ritual depends on the dual-root selfie feedback loop
         # so the council has the emotional telemetry before ruling.
-        self._require_capsules(
+        manifest_capsule, selfie_capsule, feedback_capsule = self._resolve_capsules(
             "capsule.summary.manifest.v1",
             "capsule.selfie.dualroot.q.cici.v1",
             "capsule.selfie.dualroot.q.cici.v1.feedback.v1",
@@ -882,10 +1133,6 @@ class WorldEngine:
             )
             return existing
 
-        manifest_capsule = self.capsule_registry["capsule.summary.manifest.v1"]
-        selfie_capsule = self.capsule_registry["capsule.selfie.dualroot.q.cici.v1"]
-        feedback_capsule = self.capsule_registry["capsule.selfie.dualroot.q.cici.v1.feedback.v1"]
-
         default_conflicts = [
             {
                 "file": "main.py",
@@ -985,10 +1232,7 @@ class WorldEngine:
 
         capsule = Capsule("capsule.adjudication.merge_conflict.v1", payload)
         self.capsule_registry[capsule.capsule_id] = capsule
-        self.artifacts["capsule.adjudication.merge_conflict.v1.json"] = json.dumps(
-            capsule.as_dict(),
-            indent=2,
-        )
+        self.artifacts["capsule.adjudication.merge_conflict.v1.json"] = _compact_json(capsule.as_dict())
         self.log_action("adjudication.stage", {"status": "sealed", "digest": capsule.digest})
         return capsule
     def finalize_and_bind(self) -> Dict[str, str]:
@@ -1047,43 +1291,77 @@ class WorldEngine:
             "echo_digest": capsule_echo.digest,
             "shot_count": str(len(shots)),
         }
-        self.artifacts["exports.json"] = json.dumps(exports, indent=2)
+        self.artifacts["exports.json"] = _compact_json(exports)
         self.log_action("finalize_and_bind", {"status": "complete", "exports": exports})
         return exports
 
 
+def _tick_run_starts(ticks: Sequence[int], interval: int) -> List[int]:
+    """Return the first row of each run of ``interval``-aligned ticks.
+
+    ``ticks`` must be non-decreasing, as the column built by ``rehearse_scene``
+    is, so each run is skipped with one bisection instead of a per-row test.
+    """
+
+    rows: List[int] = []
+    row, total = 0, len(ticks)
+    while row < total:
+        tick = ticks[row]
+        if tick % interval == 0:
+            rows.append(row)
+        row = bisect_right(ticks, tick, row)
+    return rows
+
+
+def _format_log_entry(entry: Dict[str, object]) -> str:
+    return f"[{entry['timestamp']}] ACTION: {entry['action']} - {_compact_json(entry['details'])}"
+
+
+def _enable_cli_logging() -> None:
+    """Echo audit log lines to stdout, as CLI runs always have."""
+
+    if any(getattr(handler, "_world_engine_cli", False) for handler in logger.handlers):
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler._world_engine_cli = True  # type: ignore[attr-defined]
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
 def run_default_sequence() -> Dict[str, Capsule]:
     """Execute the canonical orchestration run used by docs and samples."""
 
     engine = WorldEngine()
-    engine.load_capsules(
-        [
-            {"capsule_id": "lexicon.qube.v1"},
-            {"capsule_id": "seed.core.v1"},
-            {"capsule_id": "ledger.cadence.v1"},
-            {"capsule_id": "lock.attestation.v1"},
-        ]
-    )
-    engine.emit_lora_map()
-    engine.rehearse_scene()
-    engine.fork_scene()
-    engine.inscribe_canon_entry()
-    engine.build_qube()
-    engine.run_ci()
-    engine.render_final()
-    engine.finalize_and_bind()
-    engine.stage_rehearsal_scrollstream()
-    engine.stage_preview_hud()
-    engine.emit_summary_manifest()
-    engine.stage_feedback_loop()
-    engine.stage_adjudication_capsule()
-    engine.generate_shot_list()
-    engine.finalize_and_bind()
+    with engine.batched_logs():
+        engine.load_capsules(
+            [
+                {"capsule_id": "lexicon.qube.v1"},
+                {"capsule_id": "seed.core.v1"},
+                {"capsule_id": "ledger.cadence.v1"},
+                {"capsule_id": "lock.attestation.v1"},
+            ]
+        )
+        engine.emit_lora_map()
+        engine.rehearse_scene()
+        engine.fork_scene()
+        engine.inscribe_canon_entry()
+        engine.build_qube()
+        engine.run_ci()
+        engine.render_final()
+        engine.finalize_and_bind()
+        engine.stage_rehearsal_scrollstream()
+        engine.stage_preview_hud()
+        engine.emit_summary_manifest()
+        engine.stage_feedback_loop()
+        engine.stage_adjudication_capsule()
+        engine.generate_shot_list()
+        engine.finalize_and_bind()
     return engine.capsule_registry
 
 
 if __name__ == "__main__":  # pragma: no cover - convenience CLI
-    engine = WorldEngine()
+    engine = WorldEngine(verbose=True)
 
     # Load base capsules and execute the pipeline.
     engine.load_capsules(
@@ -11,7 +11,7 @@ from qube.moemodel.v1.src.gating.shimmer_router import RouteDecision, ShimmerRou
 from qube.moemodel.v1.src.hud.shimmer_renderer import ShimmerRenderer
 
 
-@dataclass
+@dataclass(slots=True)
 class RehearsalResult:
     """Summary of a rehearsal run."""
 
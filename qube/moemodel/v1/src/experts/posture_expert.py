@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class PostureExpertConfig:
     """Configuration controlling the expert's target gestures."""
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class RefusalExpertConfig:
     """Parameters defining how refusal messaging is constructed."""
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass
+from functools import partial
 from typing import Iterable, List, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteDecision:
     """Represents a routing outcome for a token batch."""
 
@@ -14,6 +17,25 @@ class RouteDecision:
     confidence: float
 
 
+@dataclass(slots=True)
+class RouteBatch:
+    """Column-wise routing outcome: one expert index and confidence per token."""
+
+    expert_indices: array
+    confidences: array
+
+    def __len__(self) -> int:
+        return len(self.expert_indices)
+
+    def decisions(self) -> List[RouteDecision]:
+        """Expand the batch into per-token ``RouteDecision`` objects."""
+
+        return [
+            RouteDecision(expert_index=expert, confidence=score)
+            for expert, score in zip(self.expert_indices, self.confidences)
+        ]
+
+
 class ShimmerRouter:
     """Dispatches tokens to experts based on Spark resonance scores."""
 
@@ -25,11 +47,37 @@ class ShimmerRouter:
     def route(self, resonance_scores: Iterable[float]) -> List[RouteDecision]:
         """Map resonance scores to expert indices using the configured thresholds."""
 
-        decisions: List[RouteDecision] = []
-        for score in resonance_scores:
-            expert = self._select_expert(score)
-            decisions.append(RouteDecision(expert_index=expert, confidence=score))
-        return decisions
+        scores = list(resonance_scores)
+        return [
+            RouteDecision(expert_index=expert, confidence=score)
+            for expert, score in zip(self.route_indices(scores), scores)
+        ]
+
+    def route_batch(self, resonance_scores: Iterable[float]) -> RouteBatch:
+        """Route a batch into packed index/confidence columns."""
+
+        confidences = array("d", resonance_scores)
+        expert_indices = array("l", self.route_indices(confidences))
+        return RouteBatch(expert_indices=expert_indices, confidences=confidences)
+
+    def route_indices(self, resonance_scores: Iterable[float]) -> List[int]:
+        """Return only the expert index for each score.
+
+        Batch callers such as ``TransformerBlock`` need no ``RouteDecision``
+        objects, so this skips building them; for ascending thresholds each
+        score is classified by ``bisect_left``.
+        """
+
+        thresholds = tuple(self.thresholds)
+        if all(low <= high for low, high in zip(thresholds, thresholds[1:])):
+            # For ascending thresholds the first ``score <= threshold`` match
+            # is exactly the bisect_left insertion point.  NaN fails every
+            # comparison, so it overflows past the last expert as in
+            # ``_select_expert`` (bisect would place it at index 0).
+            select = partial(bisect_left, thresholds)
+            overflow = len(thresholds)
+            return [select(score) if score == score else overflow for score in resonance_scores]
+        return [self._select_expert(score) for score in resonance_scores]
 
     def _select_expert(self, score: float) -> int:
         for index, threshold in enumerate(self.thresholds):
@@ -7,7 +7,7 @@ from datetime import UTC, datetime
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderPayload:
     """Structure describing shimmer render components."""
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Callable, List
 
 
-@dataclass
+@dataclass(slots=True)
 class CapsuleHook:
     """A lifecycle hook triggered at key capsule stages."""
 
@@ -14,7 +14,7 @@ class CapsuleHook:
     callback: Callable[[], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class CapsuleManager:
     """Coordinates capsule lifecycle events for CiCi's replay stack."""
 
@@ -37,6 +37,8 @@ class CapsuleManager:
         self._emit("feedback_loop")
 
     def _emit(self, event: str) -> None:
+        # ``hooks`` is public and may be edited in place, so dispatch always
+        # reads it directly rather than a derived per-event table.
         for hook in self.hooks:
             if hook.name == event:
                 hook.callback()
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Callable, Iterable, List, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformerBlockConfig:
     """Configuration for the MoE transformer block."""
 
@@ -31,7 +31,15 @@ class TransformerBlock:
     def forward(self, inputs: List[float], resonance_scores: Iterable[float]) -> List[float]:
         """Route inputs via the provided router and return processed signals."""
 
-        expert_indices = list(self.router(resonance_scores))
+        return self.apply_experts(inputs, list(self.router(resonance_scores)))
+
+    def apply_experts(self, inputs: Sequence[float], expert_indices: Sequence[int]) -> List[float]:
+        """Process inputs whose expert indices are already known.
+
+        Accepts any index sequence, including ``RouteBatch.expert_indices``,
+        so batch callers can route once and skip ``RouteDecision`` objects.
+        """
+
         if len(expert_indices) != len(inputs):
             raise ValueError("Router output length must match inputs")
         # Placeholder: echo inputs tagged by expert index.
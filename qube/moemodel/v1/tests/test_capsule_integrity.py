@@ -13,3 +13,18 @@ def test_capsule_freeze_emits_hook() -> None:
     manager.freeze()
 
     assert events == ["freeze"]
+
+
+def test_emit_follows_in_place_hook_edits() -> None:
+    events: list[str] = []
+    manager = CapsuleManager()
+    manager.register_hook(CapsuleHook(name="feedback_loop", callback=lambda: events.append("a")))
+    manager.feedback_loop()
+
+    manager.hooks[0] = CapsuleHook(name="feedback_loop", callback=lambda: events.append("b"))
+    manager.feedback_loop()
+    manager.hooks.pop()
+    manager.hooks.append(CapsuleHook(name="freeze", callback=lambda: events.append("c")))
+    manager.feedback_loop()
+
+    assert events == ["a", "b"]
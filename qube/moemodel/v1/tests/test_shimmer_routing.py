@@ -0,0 +1,21 @@
+"""Shimmer router expert selection scenarios."""
+
+from __future__ import annotations
+
+import math
+
+from qube.moemodel.v1.src.gating.shimmer_router import ShimmerRouter
+
+
+def test_route_indices_matches_threshold_scan() -> None:
+    router = ShimmerRouter([0.2, 0.5, 0.8])
+    scores = [0.1, 0.2, 0.35, 0.5, 0.79, 0.8, 0.95, -1.0]
+
+    assert router.route_indices(scores) == [router._select_expert(score) for score in scores]
+
+
+def test_nan_score_routes_to_overflow_expert() -> None:
+    router = ShimmerRouter([0.2, 0.5, 0.8])
+
+    assert router.route_indices([0.1, math.nan, 0.3]) == [0, 3, 1]
+    assert router.route_batch([math.nan]).expert_indices.tolist() == [3]
@@ -1,7 +1,6 @@
 """Screenplay capsule helpers for sovereign relay scripting."""
 
 from .library import (
-    LIBRARY,
     ActSummary,
     RelayLink,
     Scene,
@@ -11,6 +10,16 @@ from .library import (
     ScreenplayLibrary,
 )
 
+
+def __getattr__(name: str):
+    # Defer to ``library`` so ``LIBRARY`` stays lazy at the package level too.
+    if name == "LIBRARY":
+        from . import library
+
+        return library.LIBRARY
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "LIBRARY",
     "ActSummary",
@@ -2,13 +2,35 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field, validator
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+_T = TypeVar("_T")
+
+_beat_id = attrgetter("beat_id")
+_scene_id = attrgetter("scene_id")
+_act_id = attrgetter("act_id")
+
+
+def _ordered(items: List[_T], key: Callable[[_T], str]) -> List[_T]:
+    """Return *items* sorted by *key*; authored data is usually in order already."""
+
+    keys = [key(item) for item in items]
+    if all(low <= high for low, high in zip(keys, keys[1:])):
+        return items
+    return sorted(items, key=key)
+
 
 class RelayLink(BaseModel):
     """Reference to a capsule or policy activated during a beat."""
@@ -43,7 +65,7 @@ class Scene(BaseModel):
 
     @validator("beats")
     def ensure_beats_sorted(cls, value: List[SceneBeat]) -> List[SceneBeat]:
-        return sorted(value, key=lambda beat: beat.beat_id)
+        return _ordered(value, _beat_id)
 
     def relay_stage_sequence(self) -> List[str]:
         order: List[str] = []
@@ -86,7 +108,7 @@ class ScreenplayAct(BaseModel):
 
     @validator("scenes")
     def ensure_scenes_sorted(cls, value: List[Scene]) -> List[Scene]:
-        return sorted(value, key=lambda scene: scene.scene_id)
+        return _ordered(value, _scene_id)
 
     def execution_branch(self) -> Dict[str, object]:
         return {
@@ -129,15 +151,20 @@ class ScreenplayCapsule(BaseModel):
 
     @validator("acts")
     def ensure_acts_sorted(cls, value: List[ScreenplayAct]) -> List[ScreenplayAct]:
-        return sorted(value, key=lambda act: act.act_id)
+        return _ordered(value, _act_id)
 
     def summary(self) -> Dict[str, object]:
-        total_runtime = sum(scene.runtime_seconds for act in self.acts for scene in act.scenes)
+        scenes = 0
+        total_runtime = 0
+        for act in self.acts:
+            scenes += len(act.scenes)
+            for scene in act.scenes:
+                total_runtime += scene.runtime_seconds
         return {
             "capsule_id": self.capsule_id,
             "title": self.title,
             "duration_minutes": self.duration_minutes,
-            "scenes": sum(len(act.scenes) for act in self.acts),
+            "scenes": scenes,
             "runtime_seconds": total_runtime,
             "themes": self.themes,
         }
@@ -146,6 +173,55 @@ class ScreenplayCapsule(BaseModel):
         return [act.execution_branch() for act in self.acts]
 
 
+# Screenplays under data/scripts are authored and reviewed in this repo, so
+# the library builds them without re-running pydantic validation.  Flip this
+# off to validate every on-disk capsule (e.g. in CI when the scripts change).
+TRUST_ONDISK_SCREENPLAYS = True
+
+# Upper bound on threads used to read screenplay files when building a library.
+_MAX_LOAD_WORKERS = 8
+
+
+def _read_screenplay_payload(path: Path) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _construct_scene(payload: Dict[str, Any]) -> Scene:
+    values = dict(payload)
+    if "beats" in values:
+        beats = [SceneBeat.construct(**beat) for beat in values["beats"]]
+        values["beats"] = _ordered(beats, _beat_id)
+    return Scene.construct(**values)
+
+
+def _construct_act(payload: Dict[str, Any]) -> ScreenplayAct:
+    values = dict(payload)
+    if "scenes" in values:
+        scenes = [_construct_scene(scene) for scene in values["scenes"]]
+        values["scenes"] = _ordered(scenes, _scene_id)
+    return ScreenplayAct.construct(**values)
+
+
+def _construct_trusted_capsule(payload: Dict[str, Any]) -> ScreenplayCapsule:
+    """Build a screenplay from trusted data without pydantic validation.
+
+    Nested models are still built (and sorted as the validators would), so
+    the result behaves exactly like a ``parse_obj`` capsule.
+    """
+
+    values = dict(payload)
+    if "acts" in values:
+        acts = [_construct_act(act) for act in values["acts"]]
+        values["acts"] = _ordered(acts, _act_id)
+    alignment = dict(values["relay_alignment"])
+    alignment["clip_plan"] = ClipPlan.construct(**alignment["clip_plan"])
+    values["relay_alignment"] = RelayAlignment.construct(**alignment)
+    return ScreenplayCapsule.construct(**values)
+
+
 @dataclass
 class ActSummary:
     """Lightweight descriptor for listing screenplay capsules."""
@@ -162,21 +238,36 @@ class ScreenplayLibrary:
         self._root = root
         self._cache: Dict[str, ScreenplayCapsule] = {}
         self._index: Dict[str, Path] = {}
+        # Summaries of the loaded capsules, built on the first listing.
+        self._summaries: Dict[str, Dict[str, object]] = {}
         self._load_index()
 
     def _load_index(self) -> None:
-        for path in sorted(self._root.glob("*.json")):
-            with path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-            capsule = ScreenplayCapsule.parse_obj(payload)
+        paths = sorted(self._root.glob("*.json"))
+        if len(paths) > 1:
+            # File reads and orjson parsing release the GIL; capsule models are
+            # still built here on the calling thread, in path order.
+            with ThreadPoolExecutor(max_workers=min(len(paths), _MAX_LOAD_WORKERS)) as pool:
+                payloads = list(pool.map(_read_screenplay_payload, paths))
+        else:
+            payloads = [_read_screenplay_payload(path) for path in paths]
+        for path, payload in zip(paths, payloads):
+            if TRUST_ONDISK_SCREENPLAYS:
+                capsule = _construct_trusted_capsule(payload)
+            else:
+                capsule = ScreenplayCapsule.parse_obj(payload)
             self._cache[capsule.capsule_id] = capsule
             self._index[capsule.capsule_id] = path
 
     def list_capsules(self) -> List[ActSummary]:
         summaries: List[ActSummary] = []
         for capsule_id, path in self._index.items():
-            capsule = self._cache[capsule_id]
-            summaries.append(ActSummary(capsule_id=capsule_id, path=path, metadata=capsule.summary()))
+            summary = self._summaries.get(capsule_id)
+            if summary is None:
+                summary = self._summaries[capsule_id] = self._cache[capsule_id].summary()
+            # Hand out copies so callers editing the metadata cannot alter the cache.
+            metadata = {**summary, "themes": list(summary["themes"])}
+            summaries.append(ActSummary(capsule_id=capsule_id, path=path, metadata=metadata))
         return summaries
 
     def get_capsule(self, capsule_id: str) -> ScreenplayCapsule:
@@ -191,7 +282,13 @@ def load_library() -> ScreenplayLibrary:
     return ScreenplayLibrary(root)
 
 
-LIBRARY = load_library()
+def __getattr__(name: str):
+    # ``LIBRARY`` is resolved on first access so importing this module does
+    # not read and build every screenplay from disk.
+    if name == "LIBRARY":
+        return load_library()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "RelayLink",
@@ -11,12 +11,17 @@ import json
 from dataclasses import dataclass, asdict
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 TOTAL_POINTS = 28
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Workstream:
     """Represents one workstream within the burn-down plan."""
 
@@ -27,7 +32,7 @@ class Workstream:
     owner: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyTarget:
     """Daily burn-down target with date and focus summary."""
 
@@ -46,7 +51,7 @@ class DailyTarget:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatedDailyTarget:
     """Daily target with concrete calendar date."""
 
@@ -140,12 +145,24 @@ def build_dated_targets(kickoff: date) -> List[DatedDailyTarget]:
     return [target.dated(kickoff) for target in DAILY_TARGETS]
 
 
-def render_markdown(kickoff: date) -> str:
+def _iter_dated(kickoff: date) -> Iterator[Tuple[int, str, int, str]]:
+    """Yield ``(day, iso_date, remaining_points, focus)`` for each daily target.
+
+    The renderers only need these primitives, so no ``DatedDailyTarget`` is
+    allocated per row; ``build_dated_targets`` remains for API callers.
+    """
+
+    for target in DAILY_TARGETS:
+        calendar_date = kickoff + timedelta(days=target.day_offset)
+        yield target.day_offset, calendar_date.isoformat(), target.target_remaining_points, target.focus
+
+
+def _render_workstream_table() -> str:
     workstream_rows = "\n".join(
         f"| {ws.name} | {ws.subtasks} | {ws.estimate_points} | {ws.dependencies} | {ws.owner} |"
         for ws in WORKSTREAMS
     )
-    workstream_table = (
+    return (
         "## Workstreams\n"
         "| Workstream | Subtasks | Estimate (pts) | Dependencies | Owner |\n"
         "|---|---|---:|---|---|\n"
@@ -153,27 +170,52 @@ def render_markdown(kickoff: date) -> str:
         f"**Total planned points:** {TOTAL_POINTS}\n"
     )
 
-    dated_targets = build_dated_targets(kickoff)
-    target_rows = "\n".join(
-        f"| Day {target.day} | {target.calendar_date.isoformat()} | {target.target_remaining_points} | {target.focus} |"
-        for target in dated_targets
-    )
-    target_table = (
-        "## Daily Burn-Down Targets\n"
-        "| Day | Date | Target Remaining Points | Focus |\n"
-        "|---|---|---:|---|\n"
-        f"{target_rows}"
+
+# Workstream output does not depend on the kickoff date, so the Markdown
+# table and the JSON records are rendered once at import.
+_WORKSTREAM_TABLE = _render_workstream_table()
+_WORKSTREAM_DICTS = [asdict(ws) for ws in WORKSTREAMS]
+
+
+def render_markdown(kickoff: date) -> str:
+    parts: List[str] = [
+        _WORKSTREAM_TABLE,
+        "## Daily Burn-Down Targets",
+        "| Day | Date | Target Remaining Points | Focus |",
+        "|---|---|---:|---|",
+    ]
+    parts.extend(
+        f"| Day {day} | {calendar_date} | {remaining} | {focus} |"
+        for day, calendar_date, remaining, focus in _iter_dated(kickoff)
     )
-    return f"{workstream_table}\n{target_table}\n"
+    # Trailing empty part gives the document its final newline.
+    parts.append("")
+    return "\n".join(parts)
+
+
+def _pretty_json(payload: object) -> str:
+    """Render *payload* as two-space indented JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2, ensure_ascii=False)
 
 
 def render_json(kickoff: date) -> str:
     payload = {
         "total_points": TOTAL_POINTS,
-        "workstreams": [asdict(ws) for ws in WORKSTREAMS],
-        "daily_targets": [target.to_serializable() for target in build_dated_targets(kickoff)],
+        "workstreams": _WORKSTREAM_DICTS,
+        "daily_targets": [
+            {
+                "day": day,
+                "calendar_date": calendar_date,
+                "target_remaining_points": remaining,
+                "focus": focus,
+            }
+            for day, calendar_date, remaining, focus in _iter_dated(kickoff)
+        ],
     }
-    return json.dumps(payload, indent=2)
+    return _pretty_json(payload)
 
 
 def main(argv: Iterable[str] | None = None) -> None:
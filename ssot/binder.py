@@ -10,13 +10,19 @@ from __future__ import annotations
 
 import json
 import hashlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from pydantic import BaseModel, Field, ValidationError, validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, validator
+from pydantic.datetime_parse import parse_datetime
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Pydantic models describing the SSOT registry entries and context
@@ -54,6 +60,20 @@ class ReplayRules(BaseModel):
     override_protocol: Optional[str] = None
 
 
+_ALLOWED_ENTRY_TYPES: frozenset[str] = frozenset(
+    {
+        "asset",
+        "checkpoint",
+        "clip",
+        "design",
+        "relay",
+        "script",
+        "simulation",
+        "storyboard",
+    }
+)
+
+
 class RegistryEntry(BaseModel):
     """Represents one artifact entry inside the SSOT binder."""
 
@@ -67,6 +87,8 @@ class RegistryEntry(BaseModel):
     replay: ReplayRules
     capsule_ref: Optional[str] = None
     notes: Optional[str] = None
+    # Memoised ``leaf_hash``; entries are treated as sealed once loaded.
+    _leaf_hash: Optional[str] = PrivateAttr(default=None)
 
     class Config:
         allow_population_by_field_name = True
@@ -74,18 +96,7 @@ class RegistryEntry(BaseModel):
 
     @validator("entry_type")
     def validate_entry_type(cls, value: str) -> str:
-        allowed = {
-            "asset",
-            "checkpoint",
-            "clip",
-            "design",
-            "relay",
-            "script",
-            "simulation",
-            "storyboard",
-        }
-        allowed = {"script", "storyboard", "asset", "clip", "checkpoint"}
-        if value not in allowed:
+        if value not in _ALLOWED_ENTRY_TYPES:
             raise ValueError(f"entry type '{value}' is not part of the canonical binder")
         return value
 
@@ -96,8 +107,11 @@ class RegistryEntry(BaseModel):
         reproducible across runs and environments.
         """
 
-        serialized = self.json(by_alias=True, sort_keys=True, exclude={"notes"})
-        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        leaf = self._leaf_hash
+        if leaf is None:
+            serialized = self.json(by_alias=True, sort_keys=True, exclude={"notes"})
+            leaf = self._leaf_hash = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        return leaf
 
 
 class RegistryEnvelope(BaseModel):
@@ -130,19 +144,60 @@ def _hash_pair(left: str, right: str) -> str:
 
 @dataclass
 class MerkleTree:
-    """Represents a simple binary Merkle tree built from entry hashes."""
+    """Represents a simple binary Merkle tree built from entry hashes.
 
-    leaves: List[str]
+    Leaves are frozen into a tuple on construction, so the tree levels are
+    built once and reused by ``root()`` and ``appended_root()``.
+    """
+
+    leaves: Tuple[str, ...]
+    _levels: Optional[List[List[str]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.leaves = tuple(self.leaves)
 
     def root(self) -> str:
         if not self.leaves:
             return ""
-        level = self.leaves[:]
-        while len(level) > 1:
-            if len(level) % 2 == 1:
-                level.append(level[-1])
-            level = [_hash_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)]
-        return level[0]
+        return self._tree_levels()[-1][0]
+
+    def appended_root(self, leaf: str) -> str:
+        """Return the root of this tree with *leaf* appended as a new last leaf.
+
+        Only the right-most node of each level changes, and every sibling it
+        pairs with is already cached, so this costs O(log N) hashes instead
+        of rebuilding the whole tree.
+        """
+
+        levels = self._tree_levels()
+        node = leaf
+        index = len(self.leaves)
+        depth = 0
+        while index > 0:
+            if index % 2:
+                node = _hash_pair(levels[depth][index - 1], node)
+            else:
+                # Odd-length level: the last node is paired with itself.
+                node = _hash_pair(node, node)
+            index //= 2
+            depth += 1
+        return node
+
+    def _tree_levels(self) -> List[List[str]]:
+        levels = self._levels
+        if levels is None:
+            level = list(self.leaves)
+            levels = [level]
+            while len(level) > 1:
+                odd_tail = level[-1] if len(level) % 2 else None
+                pairs = iter(level)
+                level = [_hash_pair(left, right) for left, right in zip(pairs, pairs)]
+                if odd_tail is not None:
+                    # Odd-length level: the last node is paired with itself.
+                    level.append(_hash_pair(odd_tail, odd_tail))
+                levels.append(level)
+            self._levels = levels
+        return levels
 
 
 # ---------------------------------------------------------------------------
@@ -155,10 +210,12 @@ class SSOTBinder:
 
     def __init__(self, envelope: RegistryEnvelope):
         self._envelope = envelope
+        self._entries: Tuple[RegistryEntry, ...] = tuple(envelope.entries)
         self._entry_map: Dict[str, RegistryEntry] = {
-            entry.artifact_id: entry for entry in self._envelope.entries
+            entry.artifact_id: entry for entry in self._entries
         }
-        self._merkle = MerkleTree([entry.leaf_hash() for entry in self._envelope.entries])
+        self._leaf_hashes: List[str] = [entry.leaf_hash() for entry in self._entries]
+        self._merkle = MerkleTree(self._leaf_hashes)
 
     @property
     def capsule_id(self) -> str:
@@ -169,8 +226,13 @@ class SSOTBinder:
         return self._envelope.registry
 
     @property
-    def entries(self) -> List[RegistryEntry]:
-        return list(self._envelope.entries)
+    def entries(self) -> Tuple[RegistryEntry, ...]:
+        return self._entries
+
+    def copy_entries(self) -> List[RegistryEntry]:
+        """Return a mutable copy of the entries for callers that edit the list."""
+
+        return list(self._entries)
 
     @property
     def merkle_root(self) -> str:
@@ -183,9 +245,9 @@ class SSOTBinder:
         """Serialize the binder envelope with Merkle metadata."""
 
         entries = []
-        for entry in self._envelope.entries:
+        for entry, leaf_hash in zip(self._entries, self._leaf_hashes):
             payload = entry.dict(by_alias=True)
-            payload["leaf_hash"] = entry.leaf_hash()
+            payload["leaf_hash"] = leaf_hash
             entries.append(payload)
         return {
             "capsule_id": self.capsule_id,
@@ -214,16 +276,14 @@ class SSOTBinder:
                 ],
             }
 
-        preview_root = self._candidate_merkle_root(candidate)
+        leaf_hash = candidate.leaf_hash()
+        preview_root = self._candidate_merkle_root(leaf_hash)
         payload = candidate.dict(by_alias=True)
-        payload["leaf_hash"] = candidate.leaf_hash()
+        payload["leaf_hash"] = leaf_hash
         return {"valid": True, "candidate": payload, "merkle_preview": preview_root}
 
-    def _candidate_merkle_root(self, candidate: RegistryEntry) -> str:
-        leaves = [entry.leaf_hash() for entry in self._envelope.entries]
-        leaves.append(candidate.leaf_hash())
-        tree = MerkleTree(leaves)
-        return tree.root()
+    def _candidate_merkle_root(self, candidate_leaf: str) -> str:
+        return self._merkle.appended_root(candidate_leaf)
 
 
 # ---------------------------------------------------------------------------
@@ -239,19 +299,67 @@ def _registry_path() -> Path:
     return _data_root() / "ssot_registry.json"
 
 
+# The registry under data/ is sealed by council review in this repo, so the
+# binder builds it without re-running pydantic validation.  Flip this off to
+# validate the on-disk registry (e.g. in CI when the registry changes).
+TRUST_ONDISK_REGISTRY = True
+
+
+def _read_registry_payload(path: Path) -> Dict[str, object]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _construct_entry(payload: Dict[str, object]) -> RegistryEntry:
+    values = dict(payload)
+    # ``construct`` does not resolve aliases, so map ``type`` by hand.
+    values["entry_type"] = values.pop("type")
+    values["created_at"] = parse_datetime(values["created_at"])
+    values["council_attestation"] = CouncilAttestation.construct(**values["council_attestation"])
+    values["lineage"] = Lineage.construct(**values["lineage"])
+    values["replay"] = ReplayRules.construct(**values["replay"])
+    return RegistryEntry.construct(**values)
+
+
+def _construct_trusted_envelope(payload: Dict[str, object]) -> RegistryEnvelope:
+    """Build the registry envelope from trusted data without pydantic validation.
+
+    ``created_at`` is still parsed to a ``datetime`` and entries are sorted as
+    the validator would, so leaf hashes match a ``parse_obj`` envelope.
+    """
+
+    entries = [_construct_entry(entry) for entry in payload["entries"]]
+    entries.sort(key=lambda entry: entry.artifact_id)
+    return RegistryEnvelope.construct(
+        capsule_id=payload["capsule_id"],
+        registry=RegistryContext.construct(**payload["registry"]),
+        entries=entries,
+    )
+
+
 @lru_cache()
 def load_binder() -> SSOTBinder:
     """Load the SSOT binder from disk and return a helper wrapper."""
 
-    path = _registry_path()
-    with path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-    envelope = RegistryEnvelope.parse_obj(payload)
+    payload = _read_registry_payload(_registry_path())
+    if TRUST_ONDISK_REGISTRY:
+        envelope = _construct_trusted_envelope(payload)
+    else:
+        envelope = RegistryEnvelope.parse_obj(payload)
     return SSOTBinder(envelope)
 
 
-# Expose a module-level singleton for convenience.
-binder = load_binder()
+def __getattr__(name: str):
+    # ``binder`` is resolved on first access so importing this module (e.g.
+    # for ``MerkleTree``) does not read and seal the registry from disk.  It
+    # is not bound as a module global, so ``load_binder.cache_clear()`` is
+    # enough to reload it.
+    if name == "binder":
+        return load_binder()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CouncilAttestation",
@@ -0,0 +1,62 @@
+"""Shared fixtures for the world engine test modules."""
+
+from pathlib import Path
+import pickle
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from previz.world_engine import WorldEngine
+
+_MANIFEST = (
+    {"capsule_id": "lexicon.qube.v1"},
+    {"capsule_id": "seed.core.v1"},
+    {"capsule_id": "ledger.cadence.v1"},
+    {"capsule_id": "lock.attestation.v1"},
+)
+
+
+def _build_engine(*, stage_hud: bool) -> WorldEngine:
+    """Run the capsule pipeline through the final bind, optionally staging the HUD."""
+
+    engine = WorldEngine()
+    # Capsules keep a reference to their data, so each engine gets its own dicts.
+    engine.load_capsules([dict(item) for item in _MANIFEST])
+    engine.emit_lora_map()
+    engine.rehearse_scene()
+    engine.fork_scene()
+    engine.render_final()
+    engine.finalize_and_bind()
+    if stage_hud:
+        engine.stage_preview_hud()
+        engine.emit_summary_manifest()
+    return engine
+
+
+# The pipeline is deterministic, so each staged engine is built once per
+# session and handed to tests as a fresh unpickled copy, which is cheaper
+# than re-running the pipeline (and than ``copy.deepcopy``).
+@pytest.fixture(scope="session")
+def _ready_engine_blob() -> bytes:
+    return pickle.dumps(_build_engine(stage_hud=False))
+
+
+@pytest.fixture(scope="session")
+def _prepared_engine_blob() -> bytes:
+    return pickle.dumps(_build_engine(stage_hud=True))
+
+
+@pytest.fixture
+def ready_engine(_ready_engine_blob: bytes) -> WorldEngine:
+    """Engine with the final render bound, before the preview HUD is staged."""
+
+    return pickle.loads(_ready_engine_blob)
+
+
+@pytest.fixture
+def prepared_engine(_prepared_engine_blob: bytes) -> WorldEngine:
+    """Engine with the preview HUD and summary manifest staged."""
+
+    return pickle.loads(_prepared_engine_blob)
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import os
+from pathlib import Path
+import pickle
+import subprocess
+import sys
 
 import pytest
 
@@ -24,6 +30,9 @@ from capsule.anomaly.trace.v1 import (
 )
 
 
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
 @pytest.fixture(scope="module")
 def expected_payload() -> dict[str, object]:
     """Canonical payload mirrored from the fossilized JSON resource."""
@@ -119,3 +128,44 @@ def test_resource_payload_matches(expected_payload: dict[str, object]) -> None:
     """The bundled JSON resource should stay aligned with the dataclass payload."""
 
     assert load_protocol_resource() == expected_payload
+
+
+def test_protocol_hash_is_stable_and_matches_equality() -> None:
+    """Equal protocols should hash alike so they can key caches."""
+
+    rebuilt = AnomalyTraceProtocol(
+        capsuleId=DEFAULT_PROTOCOL.capsuleId,
+        title=DEFAULT_PROTOCOL.title,
+        description=DEFAULT_PROTOCOL.description,
+        trigger=DEFAULT_PROTOCOL.trigger,
+        response=DEFAULT_PROTOCOL.response,
+        visualGrammar=DEFAULT_PROTOCOL.visualGrammar,
+        attestation=DEFAULT_PROTOCOL.attestation,
+        status=DEFAULT_PROTOCOL.status,
+    )
+
+    assert rebuilt == DEFAULT_PROTOCOL
+    assert hash(rebuilt) == hash(DEFAULT_PROTOCOL) == hash(DEFAULT_PROTOCOL)
+    assert {DEFAULT_PROTOCOL: "cached"}[rebuilt] == "cached"
+
+
+def test_pickled_protocol_rehashes_under_the_loading_hash_seed(tmp_path: Path) -> None:
+    """A memoized hash must not travel with the pickle to another process."""
+
+    hash(DEFAULT_PROTOCOL)  # populate the memoized hashes before pickling
+    blob = tmp_path / "protocol.pickle"
+    blob.write_bytes(pickle.dumps(DEFAULT_PROTOCOL))
+    assert pickle.loads(blob.read_bytes()) == DEFAULT_PROTOCOL
+    assert "_hash" not in {field.name for field in dataclasses.fields(DEFAULT_PROTOCOL)}
+
+    script = (
+        "import pickle, sys\n"
+        "from capsule.anomaly.trace.v1 import DEFAULT_PROTOCOL\n"
+        "loaded = pickle.loads(open(sys.argv[1], 'rb').read())\n"
+        "assert loaded == DEFAULT_PROTOCOL\n"
+        "assert hash(loaded) == hash(DEFAULT_PROTOCOL)\n"
+        "assert hash(loaded.response) == hash(DEFAULT_PROTOCOL.response)\n"
+        "assert hash(loaded.visualGrammar) == hash(DEFAULT_PROTOCOL.visualGrammar)\n"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": "1234", "PYTHONPATH": str(_PROJECT_ROOT)}
+    subprocess.run([sys.executable, "-c", script, str(blob)], check=True, env=env)
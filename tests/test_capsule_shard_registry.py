@@ -1,4 +1,7 @@
+import copy
+import dataclasses
 import pathlib
+import pickle
 import sys
 
 import pytest
@@ -25,6 +28,20 @@ def test_shard_validate_overlay(shard):
     assert not shard.validate_overlay("spark-attestation-99")
 
 
+def test_emotional_payload_map_is_read_only_snapshot():
+    payload = {"rupture": "reflect"}
+    shard = Shard(
+        shard_id="braid:beta",
+        overlay_signature="spark-attestation-02",
+        emotional_payload_map=payload,
+    )
+    payload["rupture"] = "ignore"
+
+    assert shard.emotional_payload_map == {"rupture": "reflect"}
+    with pytest.raises(TypeError):
+        shard.emotional_payload_map["rupture"] = "ignore"  # type: ignore[index]
+
+
 def test_register_and_trigger_hooks(shard):
     events = []
 
@@ -96,3 +113,13 @@ def test_registry_require_missing():
     with pytest.raises(KeyError):
         registry.require("missing-shard")
 
+
+
+def test_shard_supports_copy_pickle_and_asdict(shard):
+    for clone in (copy.copy(shard), copy.deepcopy(shard), pickle.loads(pickle.dumps(shard))):
+        assert clone.shard_id == shard.shard_id
+        assert clone.emotional_payload_map == {"rupture": "reflect"}
+        with pytest.raises(TypeError):
+            clone.emotional_payload_map["rupture"] = "ignore"  # type: ignore[index]
+
+    assert dataclasses.asdict(shard)["emotional_payload_map"] == {"rupture": "reflect"}
@@ -1,15 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
-import sys
-import types
-from typing import Any, Callable, Dict, Iterable, List, get_args, get_origin, get_type_hints
-
-import pytest
-
-_PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(_PROJECT_ROOT) not in sys.path:
-    sys.path.append(str(_PROJECT_ROOT))
 from pathlib import Path
 import sys
 import types
@@ -30,59 +20,6 @@ def _install_pydantic_stub() -> None:
         def __init__(self, factory: Callable[[], Any]):
             self.factory = factory
 
-    def Field(*, default_factory: Callable[[], Any] | None = None, **_: Any) -> Any:
-        if default_factory is None:
-            raise TypeError("default_factory is required in this test stub")
-        return _DefaultFactory(default_factory)
-
-    def validator(*fields: str, **_: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            func._validator_fields = fields  # type: ignore[attr-defined]
-            return func
-
-        return decorator
-
-    class BaseModel:
-        __validators__: Dict[str, Iterable[Callable[[type, Any], Any]]] = {}
-        _default_factories: Dict[str, Callable[[], Any]] = {}
-
-        def __init_subclass__(cls, **kwargs: Any) -> None:
-            super().__init_subclass__(**kwargs)
-            cls._default_factories = {}
-            cls.__validators__ = {}
-
-            for name, value in cls.__dict__.items():
-                if isinstance(value, _DefaultFactory):
-                    cls._default_factories[name] = value.factory
-
-            for attr in cls.__dict__.values():
-                fields = getattr(attr, "_validator_fields", ())
-                for field in fields:
-                    cls.__validators__.setdefault(field, []).append(attr)
-
-        def __init__(self, **data: Any) -> None:
-            annotations = get_type_hints(self.__class__)
-
-            for name, factory in self.__class__._default_factories.items():
-                if name not in data:
-                    data[name] = factory()
-
-            for name in annotations:
-                if name in data:
-                    value = self._convert_value(annotations[name], data[name])
-                else:
-                    value = getattr(self.__class__, name, None)
-                setattr(self, name, value)
-
-            for field, validators in self.__class__.__validators__.items():
-                value = getattr(self, field)
-                for validator_fn in validators:
-                    value = validator_fn(self.__class__, value)
-                setattr(self, field, value)
-
-        @classmethod
-        def parse_obj(cls, obj: Dict[str, Any]) -> "BaseModel":
-            return cls(**obj)
     class BaseModel:
         __validators__: Dict[str, List[Callable[[type, Any], Any]]] = {}
 
@@ -100,8 +37,16 @@ def _install_pydantic_stub() -> None:
                     validators.setdefault(field, []).append(attr)
             cls.__validators__ = validators
 
+        @classmethod
+        def _field_hints(cls) -> Dict[str, Any]:
+            hints = cls.__dict__.get("__field_hints__")
+            if hints is None:
+                hints = get_type_hints(cls)
+                cls.__field_hints__ = hints
+            return hints
+
         def __init__(self, **data: Any) -> None:
-            annotations: Dict[str, Any] = get_type_hints(self.__class__)
+            annotations = self._field_hints()
             values: Dict[str, Any] = {}
             for name, annotation in annotations.items():
                 if name in data:
@@ -151,6 +96,19 @@ def _install_pydantic_stub() -> None:
         def parse_obj(cls, obj: Dict[str, Any]) -> "BaseModel":
             return cls(**obj)
 
+        @classmethod
+        def construct(cls, **values: Any) -> "BaseModel":
+            instance = cls.__new__(cls)
+            for name in cls._field_hints():
+                if name in values:
+                    value = values[name]
+                else:
+                    value = getattr(cls, name, None)
+                    if isinstance(value, _DefaultFactory):
+                        value = value.factory()
+                setattr(instance, name, value)
+            return instance
+
     def Field(*, default_factory: Callable[[], Any] | None = None, **_: Any) -> Any:
         if default_factory is None:
             raise ValueError("default_factory is required in this test stub")
@@ -163,8 +121,12 @@ def _install_pydantic_stub() -> None:
 
         return decorator
 
+    def PrivateAttr(default: Any = None, **_: Any) -> Any:
+        return default
+
     module.BaseModel = BaseModel
     module.Field = Field
+    module.PrivateAttr = PrivateAttr
     module.validator = validator
     sys.modules["pydantic"] = module
 
@@ -195,3 +157,42 @@ def test_duration_seconds_accounts_for_non_zero_start():
     )
 
     assert ledger.duration_seconds() == pytest.approx((25 - 10) / 10)
+
+
+def test_track_for_collects_poses_per_car():
+    moving = SubjectPose(x=1.0, y=2.0, yaw=0.5)
+    ledger = MotionLedger(
+        capsule_id="capsule",
+        scene="scene",
+        fps=10,
+        frames=[
+            MotionFrame(frame=2, cars={"a": moving, "b": make_pose()}, camera=make_camera()),
+            MotionFrame(frame=1, cars={"a": make_pose()}, camera=make_camera()),
+        ],
+        style_capsules=[],
+    )
+
+    assert ledger.track_for("a") == [make_pose(), moving]
+    assert ledger.track_for("b") == [make_pose()]
+    assert ledger.track_for("missing") == []
+
+
+@pytest.mark.parametrize(
+    ("frame", "error"),
+    [
+        ({"frame": 1, "cars": {}}, ValueError),
+        ({"frame": 1, "camera": {"pan": 0.0, "tilt": 0.0}}, ValueError),
+        (5, (TypeError, ValueError)),
+        (
+            {"frame": 1, "cars": {"car": 3}, "camera": {"pan": 0.0, "tilt": 0.0, "zoom": 1.0}},
+            (TypeError, ValueError),
+        ),
+    ],
+)
+def test_malformed_frames_raise_validation_errors(frame, error):
+    # pydantic's ValidationError is a ValueError; KeyError or AttributeError
+    # would escape validation instead of being reported.
+    with pytest.raises(error):
+        MotionLedger.parse_obj(
+            {"capsule_id": "capsule", "scene": "scene", "fps": 10, "frames": [frame]}
+        )
@@ -1,31 +1,14 @@
 """Tests for the rehearsal scrollstream capsule lifecycle."""
 
+import json
 from pathlib import Path
-import sys
 
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from previz.world_engine import WorldEngine
 
-
-def build_engine_ready() -> WorldEngine:
-    engine = WorldEngine()
-    engine.load_capsules(
-        [
-            {"capsule_id": "lexicon.qube.v1"},
-            {"capsule_id": "seed.core.v1"},
-            {"capsule_id": "ledger.cadence.v1"},
-            {"capsule_id": "lock.attestation.v1"},
-        ]
-    )
-    engine.emit_lora_map()
-    engine.rehearse_scene()
-    engine.fork_scene()
-    engine.render_final()
-    engine.finalize_and_bind()
-    return engine
+_SCROLLSTREAM_EVENTS = ("audit.summary", "audit.proof", "audit.execution")
+_REPLAY_PULSES = (0.33, 0.66, 0.99)
 
 
 def test_stage_rehearsal_scrollstream_requires_capsules() -> None:
@@ -37,20 +20,45 @@ def test_stage_rehearsal_scrollstream_requires_capsules() -> None:
     assert "capsule.rehearsal.boo.v2" in str(excinfo.value)
 
 
-def test_stage_rehearsal_scrollstream_emits_three_events() -> None:
-    engine = build_engine_ready()
-
-    capsule = engine.stage_rehearsal_scrollstream()
+def test_stage_rehearsal_scrollstream_emits_three_events(ready_engine: WorldEngine) -> None:
+    capsule = ready_engine.stage_rehearsal_scrollstream()
 
     assert capsule.capsule_id == "capsule.rehearsal.scrollstream.v1"
     ledger = capsule.data["scrollstream_ledger"]
-    assert [entry["event"] for entry in ledger] == [
-        "audit.summary",
-        "audit.proof",
-        "audit.execution",
-    ]
+    assert tuple(entry["event"] for entry in ledger) == _SCROLLSTREAM_EVENTS
     assert [entry["sequence"] for entry in ledger] == [1, 2, 3]
     assert capsule.data["hud_shimmer"]["status"] == "confirmed"
-    assert capsule.data["replay_glyph"]["pulse_sequence"] == [0.33, 0.66, 0.99]
+    assert capsule.data["replay_glyph"]["pulse_sequence"] == list(_REPLAY_PULSES)
     # Ensure artifact export occurs for downstream chaining.
-    assert "capsule.rehearsal.scrollstream.v1.json" in engine.artifacts
+    assert "capsule.rehearsal.scrollstream.v1.json" in ready_engine.artifacts
+
+
+def test_dump_artifacts_writes_each_payload(ready_engine: WorldEngine, tmp_path: Path) -> None:
+    ready_engine.stage_rehearsal_scrollstream()
+
+    written = ready_engine.dump_artifacts(tmp_path / "out")
+
+    assert sorted(Path(path).name for path in written) == sorted(ready_engine.artifacts)
+    for name, payload in ready_engine.artifacts.items():
+        assert (tmp_path / "out" / name).read_text(encoding="utf-8") == payload
+
+
+def test_pretty_reindents_json_artifacts(ready_engine: WorldEngine) -> None:
+    capsule = ready_engine.stage_rehearsal_scrollstream()
+
+    name = "capsule.rehearsal.scrollstream.v1.json"
+    assert "\n" not in ready_engine.artifacts[name]
+    pretty = ready_engine.pretty(name)
+    assert pretty.startswith('{\n  "capsule_id"')
+    assert json.loads(pretty) == capsule.as_dict()
+    ledger = "ledger.motion.v2.jsonl"
+    assert ready_engine.pretty(ledger) == ready_engine.artifacts[ledger]
+
+
+def test_as_dict_returns_a_fresh_mapping(ready_engine: WorldEngine) -> None:
+    capsule = ready_engine.stage_rehearsal_scrollstream()
+
+    capsule.as_dict()["data"] = {}
+
+    assert capsule.as_dict()["data"] is capsule.data
+    assert json.loads(ready_engine.pretty("capsule.rehearsal.scrollstream.v1.json"))["data"]